@@ -0,0 +1,37 @@
+import pytest
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+
+TEMPLATES = {
+    "small.txt": "Hello, {{ username }}!",
+    "large.txt": "\n".join(f"Line {i}: {{{{ username }}}} works at {{{{ company }}}}." for i in range(2000)),
+    "base.txt": "<h1>{{ company }}</h1>{% block body %}{% endblock %}<footer>{% block footer %}{% endblock %}</footer>",
+    "inherited.txt": (
+        "{% extends 'base.txt' %}"
+        "{% block body %}Hello, {{ username }}!{% endblock %}"
+        "{% block footer %}Sent by {{ company }}{% endblock %}"
+    ),
+    "loop.txt": "{% for row in rows %}<tr>{% for cell in row %}<td>{{ cell }}</td>{% endfor %}</tr>{% endfor %}",
+}
+
+VARIABLES = {
+    "username": "prefect",
+    "company": "Acme",
+    "rows": [[f"{row}-{column}" for column in range(10)] for row in range(500)],
+}
+
+
+@pytest.fixture(scope="session")
+def search_path(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("templates")
+    for name, source in TEMPLATES.items():
+        (path / name).write_text(source)
+
+    return str(path)
+
+
+@pytest.fixture
+def jinja_env_block(search_path) -> JinjaEnvironmentBlock:
+    block = JinjaEnvironmentBlock(search_path=search_path, namespace={"company": "Acme"})
+    block.invalidate_env()
+    return block
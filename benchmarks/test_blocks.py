@@ -0,0 +1,66 @@
+"""Benchmarks of the environments built by `JinjaEnvironmentBlock`."""
+import pytest
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+
+TEMPLATE_NAMES = ["small.txt", "large.txt", "inherited.txt", "loop.txt"]
+
+
+def test_get_env_cold(benchmark, jinja_env_block):
+    benchmark.group = "get_env"
+
+    def get_env():
+        jinja_env_block.invalidate_env()
+        return jinja_env_block.get_env()
+
+    benchmark(get_env)
+
+
+def test_get_env_warm(benchmark, jinja_env_block):
+    benchmark.group = "get_env"
+    jinja_env_block.get_env()
+
+    benchmark(jinja_env_block.get_env)
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_get_template_cold(benchmark, jinja_env_block, name):
+    benchmark.group = f"get_template-{name}"
+
+    def get_template():
+        jinja_env_block.invalidate_env()
+        return jinja_env_block.get_env().get_template(name)
+
+    benchmark(get_template)
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_get_template_warm(benchmark, jinja_env_block, name):
+    benchmark.group = f"get_template-{name}"
+    jinja_env_block.get_env().get_template(name)
+
+    def get_template():
+        return jinja_env_block.get_env().get_template(name)
+
+    benchmark(get_template)
+
+
+def test_get_env_warm_large_namespace(benchmark, search_path):
+    benchmark.group = "get_env-large-namespace"
+    namespace = {f"country-{i}": {"name": f"Country {i}", "vat_rate": i / 100} for i in range(50000)}
+    jinja_env_block = JinjaEnvironmentBlock(search_path=search_path, namespace=namespace)
+    jinja_env_block.get_env()
+
+    benchmark(jinja_env_block.get_env)
+
+
+def test_get_env_validated_copy_large_namespace(benchmark, search_path):
+    benchmark.group = "get_env-large-namespace"
+    namespace = {f"country-{i}": {"name": f"Country {i}", "vat_rate": i / 100} for i in range(50000)}
+    jinja_env_block = JinjaEnvironmentBlock(search_path=search_path, namespace=namespace)
+    jinja_env_block.get_env()
+
+    def get_env():
+        return JinjaEnvironmentBlock.validate(jinja_env_block).get_env()
+
+    benchmark(get_env)
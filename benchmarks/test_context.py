@@ -0,0 +1,44 @@
+"""Benchmarks of the task run context made available to templates."""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from jinja2 import Template
+from prefect.client.schemas import TaskRun
+from prefect.states import Running
+
+from prefect_jinja.tasks import _get_template_context
+
+
+@pytest.fixture(scope="module")
+def run_context():
+    task_run = TaskRun(
+        flow_run_id=uuid4(),
+        task_key="benchmark",
+        dynamic_key="0",
+        tags=["benchmark"],
+        state=Running(),
+    )
+    return SimpleNamespace(task_run=task_run)
+
+
+SOURCES = {
+    "context-unused": "Hello, {{ username }}!",
+    "context-used": "Hello, {{ username }} from {{ context.tags | join(',') }}!",
+}
+
+
+@pytest.mark.parametrize("group", SOURCES)
+@pytest.mark.parametrize("mode", ["eager", "lazy"])
+def test_render_with_context(benchmark, run_context, group, mode):
+    benchmark.group = group
+    template = Template(SOURCES[group])
+
+    if mode == "eager":
+        def render():
+            return template.render({"context": run_context.task_run.dict()}, username="prefect")
+    else:
+        def render():
+            return template.render(_get_template_context(run_context), username="prefect")
+
+    assert benchmark(render).startswith("Hello, prefect")
@@ -0,0 +1,87 @@
+"""Benchmarks of the render tasks, outside and inside a Prefect flow."""
+import asyncio
+
+import pytest
+from conftest import TEMPLATES, VARIABLES
+from prefect import flow
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+from prefect_jinja.tasks import (
+    _get_template_from_string,
+    _render,
+    clear_template_cache,
+    jinja_render_from_string,
+    jinja_render_from_template,
+)
+
+TEMPLATE_NAMES = ["small.txt", "large.txt", "inherited.txt", "loop.txt"]
+RENDERS_PER_FLOW = 20
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_render_template_outside_flow(benchmark, loop, jinja_env_block, name):
+    benchmark.group = f"render-{name}"
+    template = jinja_env_block.get_env().get_template(name)
+
+    benchmark(lambda: loop.run_until_complete(template.render_async(VARIABLES)))
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+@pytest.mark.parametrize("enable_async", [True, False], ids=["async", "sync"])
+def test_render_template_by_mode(benchmark, loop, search_path, name, enable_async):
+    benchmark.group = f"mode-{name}"
+    jinja_env_block = JinjaEnvironmentBlock(search_path=search_path, enable_async=enable_async)
+    template = jinja_env_block.get_env().get_template(name)
+
+    benchmark(lambda: loop.run_until_complete(_render(template, VARIABLES)))
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_render_string_outside_flow(benchmark, loop, name):
+    benchmark.group = f"render-string-{name}"
+    if name == "inherited.txt":
+        pytest.skip("Templates from strings cannot extend other templates.")
+    clear_template_cache()
+
+    def render():
+        template, _ = _get_template_from_string(TEMPLATES[name])
+        return loop.run_until_complete(template.render_async(VARIABLES))
+
+    benchmark(render)
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_jinja_render_from_template_inside_flow(benchmark, jinja_env_block, name):
+    benchmark.group = f"flow-{name}"
+
+    @flow
+    def render_flow():
+        return [
+            jinja_render_from_template(name, jinja_env_block, **VARIABLES)
+            for _ in range(RENDERS_PER_FLOW)
+        ]
+
+    benchmark.pedantic(render_flow, rounds=3, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("name", TEMPLATE_NAMES)
+def test_jinja_render_from_string_inside_flow(benchmark, name):
+    benchmark.group = f"flow-string-{name}"
+    if name == "inherited.txt":
+        pytest.skip("Templates from strings cannot extend other templates.")
+
+    @flow
+    def render_flow():
+        return [
+            jinja_render_from_string(TEMPLATES[name], **VARIABLES)
+            for _ in range(RENDERS_PER_FLOW)
+        ]
+
+    benchmark.pedantic(render_flow, rounds=3, warmup_rounds=1)
@@ -1,6 +1,15 @@
 from . import _version
-from .blocks import JinjaEnvironmentBlock
-from .tasks import jinja_render_from_template, jinja_render_from_string
+from .blocks import JinjaEnvironmentBlock, jinja_environment_scope
+from .tasks import (
+    jinja_render_from_template,
+    jinja_render_from_string,
+    jinja_render_many,
+    jinja_stream_from_template,
+    jinja_render_to_file,
+    jinja_render_outdated,
+    jinja_preload,
+    jinja_render_metrics_artifact,
+    jinja_render_from_table,
+)
 
 __version__ = _version.get_versions()["version"]
-
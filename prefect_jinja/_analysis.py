@@ -0,0 +1,295 @@
+"""Static analysis of templates, based on `jinja2.meta`."""
+import threading
+import weakref
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from jinja2 import Environment, Template, meta, nodes
+
+_template_variables: "weakref.WeakKeyDictionary[Template, Optional[Tuple[FrozenSet[str], FrozenSet[str]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_template_variables_lock = threading.Lock()
+
+
+def get_referenced_templates(env: Environment, source: str) -> List[str]:
+    """
+    Finds the templates referenced by `{% extends %}`, `{% include %}`, `{% import %}` and `{% from %}` tags of
+    a template source. References computed at render time are ignored.
+
+    Args:
+        env: The Jinja environment used to parse the source.
+        source: The source of a template.
+
+    Returns:
+        A list with the names of the referenced templates.
+    """
+    return [name for name in meta.find_referenced_templates(env.parse(source)) if name is not None]
+
+
+def get_template_sources(env: Environment, name: str) -> Optional[Dict[str, str]]:
+    """
+    Gets the source of a template and of every template it references, directly or transitively.
+
+    Args:
+        env: The Jinja environment whose loader provides the sources.
+        name: Name of the template.
+
+    Raises:
+        TemplateNotFound: If a template does not exist.
+
+    Returns:
+        A dict mapping the name of each template to its source, or `None` if a template references templates
+        computed at render time, whose sources can not be known statically.
+    """
+    sources: Dict[str, str] = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in sources:
+            continue
+        source, _, _ = env.loader.get_source(env, current)
+        sources[current] = source
+        references = list(meta.find_referenced_templates(env.parse(source)))
+        if None in references:
+            return None
+        pending.extend(references)
+
+    return sources
+
+
+def get_dependency_graph(env: Environment) -> Dict[str, Set[str]]:
+    """
+    Builds the graph of references between all the templates listed by the loader of an environment.
+
+    Args:
+        env: The Jinja environment whose loader provides the templates.
+
+    Returns:
+        A dict mapping the name of each template to the names of the templates it references directly.
+    """
+    return {
+        name: set(get_referenced_templates(env, env.loader.get_source(env, name)[0]))
+        for name in env.loader.list_templates()
+    }
+
+
+def get_dependents(graph: Dict[str, Set[str]], names: Iterable[str]) -> Set[str]:
+    """
+    Finds the templates that reference any of `names`, directly or transitively, including `names` themselves.
+
+    Args:
+        graph: A dependency graph built by `get_dependency_graph`.
+        names: Names of templates.
+
+    Returns:
+        A set with the names of the dependent templates.
+    """
+    dependents: Dict[str, Set[str]] = {}
+    for name, references in graph.items():
+        for reference in references:
+            dependents.setdefault(reference, set()).add(name)
+
+    found = set(names)
+    pending = list(found)
+    while pending:
+        for dependent in dependents.get(pending.pop(), ()):
+            if dependent not in found:
+                found.add(dependent)
+                pending.append(dependent)
+
+    return found
+
+
+def _find_declared_names(ast: nodes.Template) -> Set[str]:
+    """
+    Finds the names a template assigns, loops over, imports or declares as macros, which templates it includes,
+    extends or imports may use.
+
+    Args:
+        ast: The parsed template.
+
+    Returns:
+        A set with the declared names.
+    """
+    names = {node.name for node in ast.find_all(nodes.Name) if node.ctx in ("store", "param")}
+    names.update(node.name for node in ast.find_all(nodes.Macro))
+    names.update(node.target for node in ast.find_all(nodes.Import))
+    for node in ast.find_all(nodes.FromImport):
+        names.update(name if isinstance(name, str) else name[1] for name in node.names)
+    return names
+
+
+def _find_optional_names(ast: nodes.Template) -> Set[str]:
+    """
+    Finds the names a template only uses through the `default` filter, the `defined` and `undefined` tests, or
+    inside the branches of `{% if %}` tags that test whether they are defined, which renders need not provide.
+
+    Args:
+        ast: The parsed template.
+
+    Returns:
+        A set with the optional names.
+    """
+    loaded: Set[str] = set()
+    required: Set[str] = set()
+
+    def visit(node: nodes.Node, guarded: FrozenSet[str]) -> None:
+        """Records the names loaded under a node, and those loaded outside of a guard."""
+        if isinstance(node, nodes.Name):
+            if node.ctx == "load":
+                loaded.add(node.name)
+                if node.name not in guarded:
+                    required.add(node.name)
+            return
+
+        if isinstance(node, nodes.If) and isinstance(node.test, nodes.Test):
+            visit(node.test, guarded)
+            test_guard = _get_guarded_name(node.test)
+            defined = guarded if test_guard is None or node.test.name != "defined" else guarded | {test_guard}
+            undefined = guarded if test_guard is None or node.test.name != "undefined" else guarded | {test_guard}
+            for child in node.body:
+                visit(child, defined)
+            for child in node.elif_ + node.else_:
+                visit(child, undefined)
+            return
+
+        guard = _get_guarded_name(node)
+        for child in node.iter_child_nodes():
+            visit(child, guarded | {guard} if guard is not None and child is node.node else guarded)
+
+    visit(ast, frozenset())
+    return loaded - required
+
+
+def _get_guarded_name(node: nodes.Node) -> Optional[str]:
+    """
+    Gets the name that a `default` filter or a `defined` or `undefined` test is applied to.
+
+    Args:
+        node: A node of a parsed template.
+
+    Returns:
+        The name, or `None` if the node is not such a filter or test applied directly to a name.
+    """
+    if isinstance(node, nodes.Filter) and node.name in ("default", "d"):
+        guarded = node.node
+    elif isinstance(node, nodes.Test) and node.name in ("defined", "undefined"):
+        guarded = node.node
+    else:
+        return None
+    return guarded.name if isinstance(guarded, nodes.Name) else None
+
+
+def _find_template_variables(env: Environment, name: str) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+    """
+    Finds the variables used by a template and by the templates it references, directly or transitively, and
+    those of them that must be provided: those not declared by a referencing template or by a template it extends,
+    whose scoped blocks may use the loop variables of the parent, and not only used through `default` or `defined`.
+
+    Args:
+        env: The Jinja environment whose loader provides the sources.
+        name: Name of the template.
+
+    Returns:
+        Two frozen sets with the names of the used and required variables, or `None` if they can not be known
+        statically.
+    """
+    if not env.loader.has_source_access:
+        return None
+
+    asts: Dict[str, nodes.Template] = {}
+
+    def parse(template_name: str) -> nodes.Template:
+        """Parses a template once per analysis."""
+        ast = asts.get(template_name)
+        if ast is None:
+            ast = asts[template_name] = env.parse(env.loader.get_source(env, template_name)[0])
+        return ast
+
+    def find_inherited_names(template_name: str) -> Set[str]:
+        """Finds the names declared by the templates that a template extends, directly or transitively."""
+        names: Set[str] = set()
+        seen = {template_name}
+        parents = [template_name]
+        while parents:
+            for node in parse(parents.pop()).find_all(nodes.Extends):
+                if isinstance(node.template, nodes.Const) and node.template.value not in seen:
+                    seen.add(node.template.value)
+                    names.update(_find_declared_names(parse(node.template.value)))
+                    parents.append(node.template.value)
+        return names
+
+    used: Set[str] = set()
+    required: Set[str] = set()
+    visited: Set[Tuple[str, FrozenSet[str]]] = set()
+    pending: List[Tuple[str, FrozenSet[str]]] = [(name, frozenset())]
+    while pending:
+        current, declared = pending.pop()
+        if (current, declared) in visited:
+            continue
+        visited.add((current, declared))
+        ast = parse(current)
+        references = list(meta.find_referenced_templates(ast))
+        if None in references:
+            return None
+        undeclared = meta.find_undeclared_variables(ast)
+        used.update(undeclared)
+        required.update(
+            undeclared.difference(declared, find_inherited_names(current), _find_optional_names(ast))
+        )
+        declared = declared.union(_find_declared_names(ast))
+        pending.extend((reference, declared) for reference in references)
+
+    return frozenset(used), frozenset(required)
+
+
+def _get_analysis(template: Template) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+    """
+    Gets the used and required variables of a template, computed once per compiled template.
+
+    Args:
+        template: A template loaded with `Environment.get_template`.
+
+    Returns:
+        The result of `_find_template_variables`.
+    """
+    with _template_variables_lock:
+        if template in _template_variables:
+            return _template_variables[template]
+
+    analysis = _find_template_variables(template.environment, template.name)
+    with _template_variables_lock:
+        _template_variables[template] = analysis
+
+    return analysis
+
+
+def get_template_variables(template: Template) -> Optional[FrozenSet[str]]:
+    """
+    Gets the variables used by a template loaded from an environment, including the variables of the templates
+    it extends, includes or imports. They are computed once per compiled template.
+
+    Args:
+        template: A template loaded with `Environment.get_template`.
+
+    Returns:
+        A frozen set with the names of the variables, or `None` if they can not be known statically, because the
+        template references templates computed at render time or has no source.
+    """
+    analysis = _get_analysis(template)
+    return None if analysis is None else analysis[0]
+
+
+def get_required_variables(template: Template) -> Optional[FrozenSet[str]]:
+    """
+    Gets the variables a render of a template must provide: those used by the template and by the templates it
+    extends, includes or imports, except the names the referencing templates assign or loop over.
+
+    Args:
+        template: A template loaded with `Environment.get_template`.
+
+    Returns:
+        A frozen set with the names of the variables, or `None` if they can not be known statically.
+    """
+    analysis = _get_analysis(template)
+    return None if analysis is None else analysis[1]
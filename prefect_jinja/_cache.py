@@ -0,0 +1,97 @@
+"""A small thread-safe LRU cache shared by the blocks and tasks of the collection."""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `LRUCache`, in the same shape as `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A bounded mapping that discards the least recently used entry when full.
+
+    Args:
+        maxsize: Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the cache."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Returns whether `key` is in the cache, without counting a hit or miss."""
+        return key in self._data
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Returns the value stored for `key`, creating it with `factory` on a miss. The factory runs without holding
+        the lock of the cache, so a slow factory does not block lookups of other keys; if two threads miss the same
+        key at once, both build a value and the first one stored is kept.
+
+        Args:
+            key: The cache key.
+            factory: A callable without arguments that builds the value.
+
+        Returns:
+            The cached or newly created value.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return value
+
+        value = factory()
+        with self._lock:
+            try:
+                return self._data[key]
+            except KeyError:
+                self._data[key] = value
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                return value
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes `key` from the cache if present.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache and resets its statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Reports the statistics of the cache.
+
+        Returns:
+            The hits, misses, maximum size and current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,142 @@
+"""Rendering of templates in a pool of worker processes, kept warm across task runs."""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from jinja2 import Environment
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+
+_worker_env: Optional[Environment] = None
+
+MAX_POOLS = 4
+
+_pools: Dict[Tuple[Hashable, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _init_worker(jinja_environment: JinjaEnvironmentBlock) -> None:
+    """
+    Builds the environment of a worker process. Worker processes render synchronously, so the environment is
+    created without async mode, unless its templates were precompiled in async mode.
+
+    Args:
+        jinja_environment: A Jinja Environment block.
+    """
+    global _worker_env
+    if jinja_environment.get_compiled_mode() != "async":
+        jinja_environment = jinja_environment.copy(update={"enable_async": False})
+    _worker_env = jinja_environment.get_env()
+
+
+def _render_chunk(name: str, variables_list: List[Dict[str, Any]]) -> List[str]:
+    """
+    Renders a template from the environment of the worker process once for each dict of variables. The
+    environment keeps the compiled template for the next chunks.
+
+    Args:
+        name: Name of template file to render.
+        variables_list: A list of dicts, each one holding the variables of one render.
+
+    Returns:
+        A list with the rendered templates.
+    """
+    template = _worker_env.get_template(name)
+    return [template.render(variables) for variables in variables_list]
+
+
+def _get_pool(jinja_environment: JinjaEnvironmentBlock, processes: int) -> ProcessPoolExecutor:
+    """
+    Gets the pool of worker processes for the settings of a block and a number of processes, creating it if
+    needed. Up to `MAX_POOLS` pools are kept; the least recently used one is shut down to make room for a new one
+    and finishes its pending renders in the background.
+
+    Args:
+        jinja_environment: A Jinja Environment block.
+        processes: Number of worker processes.
+
+    Returns:
+        A pool of worker processes holding the environment of the block.
+    """
+    key = (jinja_environment._env_cache_key(), processes)
+    evicted: List[ProcessPoolExecutor] = []
+    with _pools_lock:
+        pool = _pools.pop(key, None)
+        if pool is None:
+            while len(_pools) >= MAX_POOLS:
+                evicted.append(_pools.pop(next(iter(_pools))))
+            pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(jinja_environment,),
+            )
+        _pools[key] = pool
+    for evicted_pool in evicted:
+        evicted_pool.shutdown(wait=False)
+    return pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Forgets a broken pool of worker processes and shuts it down, so the next render starts a new one.
+
+    Args:
+        pool: The broken pool.
+    """
+    with _pools_lock:
+        for key, kept_pool in list(_pools.items()):
+            if kept_pool is pool:
+                del _pools[key]
+    pool.shutdown(wait=False)
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    """
+    Shuts down every pool of worker processes kept by `render_in_processes`.
+
+    Args:
+        wait: Whether to wait for the pending renders and the exit of the worker processes.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+async def render_in_processes(
+    jinja_environment: JinjaEnvironmentBlock,
+    name: str,
+    variables_list: List[Dict[str, Any]],
+    processes: int,
+) -> List[str]:
+    """
+    Renders a template once for each dict of variables in a pool of worker processes, each one holding a warm
+    environment built from the block. The pool is kept for the next calls with the same block settings and number
+    of processes, alongside the pools of other settings.
+
+    Args:
+        jinja_environment: A Jinja Environment block.
+        name: Name of template file to render.
+        variables_list: A list of dicts, each one holding the variables of one render. They must be picklable.
+        processes: Number of worker processes.
+
+    Returns:
+        A list with the rendered templates, in the same order as `variables_list`.
+    """
+    chunk_size = max(1, -(-len(variables_list) // (processes * 4)))
+    chunks = [variables_list[i : i + chunk_size] for i in range(0, len(variables_list), chunk_size)]
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool(jinja_environment, processes)
+    try:
+        results = await asyncio.gather(*(loop.run_in_executor(pool, _render_chunk, name, chunk) for chunk in chunks))
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+
+    return [rendered for chunk in results for rendered in chunk]
@@ -1,9 +1,105 @@
 """A module to interact with Jinja Environment."""
-from typing import Dict, Optional
+import hashlib
+import json
+import os
+import time
+import zipfile
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Set, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    MemcachedBytecodeCache,
+    ModuleLoader,
+    PackageLoader,
+    PrefixLoader,
+    select_autoescape,
+)
 from prefect.blocks.core import Block
-from pydantic import Field
+from prefect.utilities.importtools import import_object
+from pydantic import Field, PrivateAttr
+
+from prefect_jinja._analysis import get_dependency_graph, get_dependents
+from prefect_jinja._cache import LRUCache
+from prefect_jinja.loaders import FsspecLoader, ThrottledReloadLoader
+
+ENV_CACHE_SIZE = 32
+COMPILED_MODE_FILE = "prefect_jinja_mode.txt"
+
+_env_cache = LRUCache(maxsize=ENV_CACHE_SIZE)
+_namespace_cache = LRUCache(maxsize=ENV_CACHE_SIZE)
+
+
+def clear_env_cache() -> None:
+    """
+    Discards every Jinja Environment cached by `JinjaEnvironmentBlock.get_env`, along with their compiled templates.
+
+    Example:
+        ```python
+        from prefect_jinja.blocks import clear_env_cache
+        clear_env_cache()
+        ```
+    """
+    _env_cache.clear()
+    _namespace_cache.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Makes a JSON-like value read-only, recursively.
+
+    Args:
+        value: The value to freeze.
+
+    Returns:
+        The value with dicts turned into read-only mappings and lists into tuples, at every level.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serializes the read-only mappings of a frozen namespace for the `tojson` filter.
+
+    Args:
+        value: A value the `json` module can not serialize.
+
+    Returns:
+        A dict with the same items, if the value is a mapping.
+
+    Raises:
+        TypeError: If the value is not a mapping.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _import_objects(import_paths: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Imports the objects of a dict of import paths.
+
+    Args:
+        import_paths: A dict mapping names to import paths, such as `my_module:my_function`.
+
+    Returns:
+        A dict mapping the same names to the imported objects.
+    """
+    return {name: import_object(import_path) for name, import_path in import_paths.items()}
 
 
 class JinjaEnvironmentBlock(Block):
@@ -12,8 +108,54 @@ class JinjaEnvironmentBlock(Block):
 
     Args:
         namespace (dict): A dict of variables that are available in every template loaded by the environment.
+            Values can be any JSON-serializable object, such as numbers, lists and nested dicts. They are frozen,
+            with dicts as read-only mappings and lists as tuples, and shared by all renders.
         search_path (str): A path to the directory that contains the templates. Can be relative or absolute.
-            Relative paths are relative to the running `flow` directory.
+            Relative paths are relative to the running `flow` directory. Can also be an `fsspec` URL, such as
+            `s3://bucket/templates`, to load templates from remote storage.
+        templates (dict): A dict mapping template names to their sources, served from memory. They take precedence
+            over templates with the same name from the other sources.
+        package_name (str): The name of an installed Python package that ships templates, such as `my_package`.
+        package_path (str): The directory, inside `package_name`, that contains the templates.
+        prefixes (dict): A dict mapping prefixes to directories or `fsspec` URLs. A template named `prefix/name` is
+            loaded from `name` in the directory of `prefix`.
+        remote_cache_path (str): A local directory where templates fetched from an `fsspec` URL are cached, so they
+            are only fetched again when their remote version changes.
+        prefetch_templates (bool): Whether to fetch every template from an `fsspec` URL concurrently when the
+            environment is created.
+        bytecode_cache_path (str): A directory where the bytecode of compiled templates is stored, so it survives
+            across processes and flow runs.
+        bytecode_cache_client (str): An import path, such as `my_module:client`, to a key/value client with `get` and
+            `set` methods (e.g. a Memcached or Redis client) where the bytecode of compiled templates is stored.
+            Takes precedence over `bytecode_cache_path`.
+        compiled_path (str): A zip file or directory of templates precompiled with `compile_templates` or the
+            `prefect-jinja compile` command. When set, templates are loaded from it instead of `search_path`. The
+            templates must have been compiled with the same `enable_async` setting.
+        auto_reload (bool): Whether to check if a template changed before reusing its compiled version. Disable it
+            in production to avoid filesystem checks on every render.
+        auto_reload_interval (float): Minimum number of seconds between two checks of whether a template changed.
+            `0` checks on every load.
+        enable_async (bool): Whether templates are rendered in async mode, in the event loop of the task. When
+            disabled, templates are compiled without async support and rendered in a worker thread. This avoids the
+            coroutine overhead of every expression and loop, which makes loop-heavy templates several times faster,
+            but handing the render to a thread costs a fixed few hundred microseconds, so small templates are
+            faster in async mode.
+        strict_variables (bool): Whether the render tasks check, before rendering, that every variable used by a
+            template, or by the templates it extends, includes or imports, is provided. Variables are found once per
+            compiled template with `jinja2.meta.find_undeclared_variables`.
+        profile (bool): Whether `jinja_render_from_template` profiles each render and logs the time spent on each
+            template line, block and macro. Tracing slows rendering down, so only enable it to find hot spots.
+        cache_size (int): Maximum number of compiled templates kept by the environment. `-1` keeps all of them
+            and `0` disables the cache.
+        filters (dict): A dict mapping filter names to the import paths, such as `my_module:format_currency`, of
+            custom filters. They are imported once per cached environment, including in worker processes.
+        tests (dict): A dict mapping test names to the import paths of custom tests.
+        globals (dict): A dict mapping global names to the import paths of custom functions or objects, available
+            in every template. They take precedence over the `namespace` variables with the same name.
+
+    The settings of a block are hashed once, when `get_env` is first called, and hashed again only when an attribute
+    is set or the block is copied with updates. Dict attributes, such as `namespace`, `templates` and `filters`, must
+    be replaced rather than modified in place, or the change is not seen by the cached environment.
 
     Example:
         Load a environment block:
@@ -26,18 +168,129 @@ class JinjaEnvironmentBlock(Block):
     _block_type_name = "Jinja Environment"
     # _logo_url = ""
 
-    namespace: Dict[str, Optional[str]] = Field(
+    namespace: Dict[str, Any] = Field(
         default_factory=dict,
-        description="A dict of variables that are available in every template loaded by the environment.",
+        description="A dict of variables that are available in every template loaded by the environment. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
     )
     search_path: Optional[str] = Field(
-        description="A path to the directory that contains the templates. Can be relative or absolute. Relative paths are relative to the running `flow` directory.",
+        description="A path to the directory that contains the templates. Can be relative or absolute. Relative paths are relative to the running `flow` directory. Can also be an `fsspec` URL, such as `s3://bucket/templates`.",
+    )
+    templates: Dict[str, str] = Field(
+        default_factory=dict,
+        description="A dict mapping template names to their sources, served from memory. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
+    )
+    package_name: Optional[str] = Field(
+        default=None,
+        description="The name of an installed Python package that ships templates.",
+    )
+    package_path: str = Field(
+        default="templates",
+        description="The directory, inside `package_name`, that contains the templates.",
+    )
+    prefixes: Dict[str, str] = Field(
+        default_factory=dict,
+        description="A dict mapping prefixes to directories or `fsspec` URLs. A template named `prefix/name` is loaded from `name` in the directory of `prefix`. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
+    )
+    remote_cache_path: Optional[str] = Field(
+        default=None,
+        description="A local directory where templates fetched from an `fsspec` URL are cached.",
+    )
+    prefetch_templates: bool = Field(
+        default=False,
+        description="Whether to fetch every template from an `fsspec` URL concurrently when the environment is created.",
+    )
+    bytecode_cache_path: Optional[str] = Field(
+        default=None,
+        description="A directory where the bytecode of compiled templates is stored, so it survives across processes and flow runs.",
+    )
+    bytecode_cache_client: Optional[str] = Field(
+        default=None,
+        description="An import path, such as `my_module:client`, to a key/value client with `get` and `set` methods where the bytecode of compiled templates is stored. Takes precedence over `bytecode_cache_path`.",
+    )
+    compiled_path: Optional[str] = Field(
+        default=None,
+        description="A zip file or directory of precompiled templates. When set, templates are loaded from it instead of `search_path`.",
+    )
+    auto_reload: bool = Field(
+        default=True,
+        description="Whether to check if a template changed before reusing its compiled version. Disable it in production to avoid filesystem checks on every render.",
+    )
+    auto_reload_interval: float = Field(
+        default=0.0,
+        ge=0,
+        description="Minimum number of seconds between two checks of whether a template changed. `0` checks on every load.",
+    )
+    enable_async: bool = Field(
+        default=True,
+        description="Whether templates are rendered in async mode. When disabled, templates are compiled without async support and rendered in a worker thread, which is faster for large and loop-heavy templates.",
+    )
+    strict_variables: bool = Field(
+        default=False,
+        description="Whether the render tasks check, before rendering, that every variable used by a template is provided.",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Whether `jinja_render_from_template` profiles each render and logs the time spent on each template line. Slows rendering down.",
+    )
+    cache_size: int = Field(
+        default=400,
+        ge=-1,
+        description="Maximum number of compiled templates kept by the environment. `-1` keeps all of them and `0` disables the cache.",
+    )
+    filters: Dict[str, str] = Field(
+        default_factory=dict,
+        description="A dict mapping filter names to the import paths, such as `my_module:format_currency`, of custom filters. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
+    )
+    tests: Dict[str, str] = Field(
+        default_factory=dict,
+        description="A dict mapping test names to the import paths of custom tests. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
     )
+    globals: Dict[str, str] = Field(
+        default_factory=dict,
+        description="A dict mapping global names to the import paths of custom functions or objects, available in every template. Assign a new dict instead of modifying it in place, which is not seen by `get_env` once called.",
+    )
+
+    _digests: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute and discards the hashes of the block settings, so `get_env` sees the new value.
+
+        Args:
+            name: The name of the attribute.
+            value: The new value of the attribute.
+        """
+        super().__setattr__(name, value)
+        if name != "_digests":
+            self._digests = {}
+
+    def copy(self, *args: Any, update: Optional[Dict[str, Any]] = None, **kwargs: Any) -> "JinjaEnvironmentBlock":
+        """
+        Copies the block, discarding the hashes of its settings when they are updated.
+
+        Args:
+            *args: Positional arguments passed to `pydantic.BaseModel.copy`.
+            update: Values to change in the copy.
+            **kwargs: Keyword arguments passed to `pydantic.BaseModel.copy`.
+
+        Returns:
+            A copy of the block.
+        """
+        copy = super().copy(*args, update=update, **kwargs)
+        if update:
+            copy._digests = {}
+        return copy
 
     def get_env(self) -> Environment:
         """
         Creates a Jinja Environment with a loader that searches for template files in the path provided by the
-        `search_path` attribute and sets the global variables provided by the `namespace` attribute.
+        `search_path` attribute and sets the global variables provided by the `namespace` attribute, on top of the
+        default globals of Jinja such as `range` and `dict`.
+
+        Environments are cached per process and keyed on the block settings, so blocks with the same settings share
+        one environment and its compiled templates. Use `invalidate_env` or `clear_env_cache` to discard them.
+        The settings are hashed once per block instance: replace dict attributes such as `namespace` instead of
+        modifying them in place, or the change is ignored.
 
         Returns:
             A Jinja environment.
@@ -53,11 +306,400 @@ class JinjaEnvironmentBlock(Block):
             jinja_env = example_get_jinja_environment_flow()
             ```
         """
-        loader = FileSystemLoader(self.search_path)
+        return _env_cache.get_or_create(self._env_cache_key(), self._create_env)
+
+    def get_namespace(self) -> Mapping[str, Any]:
+        """
+        Freezes the `namespace` attribute into a read-only mapping, built once and shared by every environment
+        created from blocks with the same namespace, so large lookup tables are neither copied nor rebuilt. Nested
+        dicts are frozen into read-only mappings and lists into tuples, so no render can change what another sees.
+
+        Returns:
+            A deeply read-only copy of the namespace.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates", namespace={"vat_rate": 0.2})
+            env_block.get_namespace()["vat_rate"]
+            ```
+        """
+        return _namespace_cache.get_or_create(
+            self._get_digest("namespace"), lambda: _freeze(self.namespace)
+        )
+
+    def invalidate_env(self) -> None:
+        """
+        Discards the cached Jinja Environment built from the settings of this block, if any.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            env_block.invalidate_env()
+            ```
+        """
+        _env_cache.pop(self._env_cache_key())
+
+    def preload(self, names: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict[str, float]:
+        """
+        Loads and compiles templates into the cached environment, so the first renders after a worker starts do
+        not pay for it. Templates beyond `cache_size` are evicted again.
+
+        Args:
+            names: Names of the templates to preload. Defaults to every template listed by the loader, which
+                requires `names` for templates loaded from `compiled_path`.
+            max_workers: Number of threads compiling templates in parallel. Defaults to compiling them one by one.
+
+        Raises:
+            TemplateNotFound: If a template does not exist.
+            TemplateSyntaxError: If there is a problem with a template.
+
+        Returns:
+            A dict mapping the name of each template to the seconds it took to load.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            timings = env_block.preload(max_workers=4)
+            ```
+        """
+        env = self.get_env()
+        if names is None:
+            names = env.list_templates()
+
+        def load(name: str) -> float:
+            """Compiles a template into the environment and returns the seconds it took."""
+            start = time.perf_counter()
+            env.get_template(name)
+            return time.perf_counter() - start
+
+        if max_workers is None or max_workers <= 1:
+            timings = [load(name) for name in names]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                timings = list(executor.map(load, names))
+
+        return dict(zip(names, timings))
+
+    def get_bytecode_cache(self) -> Optional[BytecodeCache]:
+        """
+        Creates the bytecode cache used by the environment, based on the `bytecode_cache_client` and
+        `bytecode_cache_path` attributes. Async and sync environments store their bytecode under different keys.
+        Subclasses can override it to plug in any other `BytecodeCache`.
+
+        Returns:
+            A Jinja bytecode cache, or `None` if the bytecode cache is not configured.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates", bytecode_cache_path="/tmp/jinja")
+            bytecode_cache = env_block.get_bytecode_cache()
+            ```
+        """
+        # Jinja keys bytecode by template name only, and async and sync bytecode are not interchangeable.
+        mode = "async" if self.enable_async else "sync"
+        if self.bytecode_cache_client is not None:
+            return MemcachedBytecodeCache(
+                import_object(self.bytecode_cache_client), prefix=f"prefect_jinja/{mode}/"
+            )
+        if self.bytecode_cache_path is not None:
+            os.makedirs(self.bytecode_cache_path, exist_ok=True)
+            return FileSystemBytecodeCache(self.bytecode_cache_path, pattern=f"__jinja2_{mode}_%s.cache")
+
+        return None
+
+    def get_loader(self) -> BaseLoader:
+        """
+        Creates the loader used by the environment: a `ModuleLoader` over `compiled_path` when templates are
+        precompiled, otherwise a loader over the configured sources, searched in this order: `templates`,
+        `search_path`, `package_name` and `prefixes`.
+
+        Raises:
+            ValueError: If the templates of `compiled_path` were compiled with another `enable_async` setting.
+
+        Returns:
+            A Jinja loader.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            loader = env_block.get_loader()
+            ```
+        """
+        if self.compiled_path is not None:
+            compiled_mode = self.get_compiled_mode()
+            mode = "async" if self.enable_async else "sync"
+            if compiled_mode is not None and compiled_mode != mode:
+                raise ValueError(
+                    f"The templates of {self.compiled_path!r} were compiled in {compiled_mode} mode, but this block "
+                    f"renders in {mode} mode. Set `enable_async={compiled_mode == 'async'}`, or compile them again "
+                    f"with `prefect-jinja compile --{mode}`."
+                )
+            return ModuleLoader(self.compiled_path)
+
+        loader = self._get_source_loader()
+        if self.auto_reload and self.auto_reload_interval > 0:
+            loader = ThrottledReloadLoader(loader, self.auto_reload_interval)
+
+        return loader
+
+    def compile_templates(self, target: str, zip: Optional[str] = "deflated") -> None:
+        """
+        Compiles every template found in the configured sources into Python modules, so environments loading them through
+        `compiled_path` skip parsing entirely. Async and sync templates compile to different code, so the
+        `enable_async` setting of the block is recorded in the target and must match the blocks loading it.
+
+        Args:
+            target: Path of the zip file, or directory if `zip` is `None`, to write the compiled templates to.
+            zip: Compression of the zip file, either `"deflated"` or `"stored"`, or `None` to write a directory.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            env_block.compile_templates("templates.zip")
+            production_block = JinjaEnvironmentBlock(compiled_path="templates.zip")
+            ```
+        """
+        env = self._create_env(loader=self._get_source_loader())
+        env.compile_templates(target, zip=zip, ignore_errors=False)
+
+        mode = "async" if self.enable_async else "sync"
+        if zip is None:
+            with open(os.path.join(target, COMPILED_MODE_FILE), "w") as file:
+                file.write(mode)
+        else:
+            with zipfile.ZipFile(target, "a") as archive:
+                archive.writestr(COMPILED_MODE_FILE, mode)
+
+    def get_compiled_mode(self) -> Optional[str]:
+        """
+        Reads the mode the templates of `compiled_path` were compiled in.
+
+        Returns:
+            `"async"` or `"sync"`, or `None` if `compiled_path` is not set or does not record its mode.
+        """
+        if self.compiled_path is None:
+            return None
+        if os.path.isdir(self.compiled_path):
+            path = os.path.join(self.compiled_path, COMPILED_MODE_FILE)
+            if not os.path.exists(path):
+                return None
+            with open(path) as file:
+                return file.read().strip()
+        with zipfile.ZipFile(self.compiled_path) as archive:
+            if COMPILED_MODE_FILE not in archive.namelist():
+                return None
+            return archive.read(COMPILED_MODE_FILE).decode("utf-8").strip()
+
+    def get_dependency_graph(self) -> Dict[str, Set[str]]:
+        """
+        Parses every template of the environment to find the templates each one extends, includes or imports.
+        References computed at render time are ignored.
+
+        Returns:
+            A dict mapping the name of each template to the names of the templates it references directly.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            graph = env_block.get_dependency_graph()
+            ```
+        """
+        return get_dependency_graph(self.get_env())
+
+    def get_template_hashes(self) -> Dict[str, str]:
+        """
+        Hashes the source of every template of the environment.
+
+        Returns:
+            A dict mapping the name of each template to the SHA-256 of its source.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            hashes = env_block.get_template_hashes()
+            ```
+        """
+        env = self.get_env()
+        return {
+            name: hashlib.sha256(env.loader.get_source(env, name)[0].encode("utf-8")).hexdigest()
+            for name in env.loader.list_templates()
+        }
+
+    def get_outdated_templates(
+        self, previous_hashes: Dict[str, str], current_hashes: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Finds the templates whose output may have changed since `previous_hashes` were taken: templates that were
+        added or changed, and templates that extend, include or import them, directly or transitively.
+
+        Args:
+            previous_hashes: The hashes returned by `get_template_hashes` at the time of the last render.
+            current_hashes: The current hashes of the templates. Computed if not provided.
+
+        Returns:
+            A sorted list with the names of the outdated templates.
+
+        Example:
+            ```python
+            env_block = JinjaEnvironmentBlock(search_path="templates")
+            hashes = env_block.get_template_hashes()
+            # ... templates change ...
+            outdated = env_block.get_outdated_templates(hashes)
+            ```
+        """
+        if current_hashes is None:
+            current_hashes = self.get_template_hashes()
+        changed = {
+            name
+            for name in current_hashes.keys() | previous_hashes.keys()
+            if current_hashes.get(name) != previous_hashes.get(name)
+        }
+        dependents = get_dependents(self.get_dependency_graph(), changed)
+
+        return sorted(name for name in dependents if name in current_hashes)
+
+    def _get_source_loader(self) -> BaseLoader:
+        """
+        Creates a loader over the configured sources, composing them with a `ChoiceLoader` when there are many.
+
+        Returns:
+            A Jinja loader.
+        """
+        loaders: List[BaseLoader] = []
+        if self.templates:
+            loaders.append(DictLoader(self.templates))
+        if self.search_path is not None:
+            loaders.append(self._get_path_loader(self.search_path))
+        if self.package_name is not None:
+            loaders.append(PackageLoader(self.package_name, self.package_path))
+        if self.prefixes:
+            loaders.append(
+                PrefixLoader({prefix: self._get_path_loader(path) for prefix, path in self.prefixes.items()})
+            )
+
+        if not loaders:
+            return FileSystemLoader(self.search_path)
+        if len(loaders) == 1:
+            return loaders[0]
+
+        return ChoiceLoader(loaders)
+
+    def _get_path_loader(self, path: str) -> BaseLoader:
+        """
+        Creates a loader over a directory, reading from remote storage when it is an `fsspec` URL.
+
+        Args:
+            path: A directory or an `fsspec` URL.
+
+        Returns:
+            A Jinja loader.
+        """
+        if "://" in path:
+            return FsspecLoader(path, cache_path=self.remote_cache_path, prefetch=self.prefetch_templates)
+
+        return FileSystemLoader(path)
+
+    def _env_cache_key(self) -> Hashable:
+        """
+        Builds the key used to cache the environment created from the settings of this block.
+
+        Returns:
+            A hashable key.
+        """
+        return type(self), self._get_digest("settings"), self._get_digest("namespace")
+
+    def _get_digest(self, kind: str) -> str:
+        """
+        Hashes the `namespace` attribute, or the other settings of this block, once per block instance, so large
+        namespaces are not serialized on every call. Setting an attribute or copying the block with updates hashes
+        it again, but dict attributes must not be modified in place once the block is used.
+
+        Args:
+            kind: Either `namespace` or `settings`.
+
+        Returns:
+            The SHA-256 digest of the JSON representation.
+        """
+        digest = self._digests.get(kind)
+        if digest is None:
+            if kind == "namespace":
+                data = json.dumps(self.namespace, sort_keys=True, default=repr)
+            else:
+                data = self.json(exclude={"namespace"}, sort_keys=True)
+            digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+            self._digests[kind] = digest
+        return digest
+
+    def _create_env(self, loader: Optional[BaseLoader] = None) -> Environment:
+        """
+        Creates a new Jinja Environment from the settings of this block.
+
+        Args:
+            loader: The loader of the environment. Defaults to the one returned by `get_loader`.
+
+        Returns:
+            A Jinja environment.
+        """
+        if loader is None:
+            loader = self.get_loader()
         env = Environment(
-            loader=loader, autoescape=select_autoescape(), enable_async=True
+            loader=loader,
+            autoescape=select_autoescape(),
+            enable_async=self.enable_async,
+            bytecode_cache=self.get_bytecode_cache(),
+            auto_reload=self.auto_reload,
+            cache_size=self.cache_size,
         )
-        if self.namespace is not None:
-            env.globals = self.namespace.copy()
+        env.globals = ChainMap({}, self.get_namespace(), env.globals)
+        env.policies["json.dumps_kwargs"] = {**env.policies["json.dumps_kwargs"], "default": _json_default}
+        env.filters.update(_import_objects(self.filters))
+        env.tests.update(_import_objects(self.tests))
+        env.globals.update(_import_objects(self.globals))
 
         return env
+
+
+_scoped_environment: ContextVar[Optional[Tuple[JinjaEnvironmentBlock, Environment]]] = ContextVar(
+    "prefect_jinja_scoped_environment", default=None
+)
+
+
+@contextmanager
+def jinja_environment_scope(jinja_environment: JinjaEnvironmentBlock) -> Iterator[Environment]:
+    """
+    Builds one Jinja Environment from a block and shares it with the render tasks called without a block inside
+    the `with` statement, so they reuse its loader state and compiled templates without the block being passed,
+    validated and hashed as a parameter of every task run.
+
+    The environment is kept in a context variable, which Prefect copies into the task runs of the flow run. It
+    stays in use until the scope exits, even if the environment cache discards it or the block is invalidated.
+
+    Args:
+        jinja_environment: A Jinja Environment block.
+
+    Yields:
+        The shared Jinja environment.
+
+    Example:
+        ```python
+        @flow
+        def send_welcome_flow(usernames: List[str]):
+            with jinja_environment_scope(JinjaEnvironmentBlock.load("email-templates")):
+                return [jinja_render_from_template("welcome.html", username=username) for username in usernames]
+        ```
+    """
+    token = _scoped_environment.set((jinja_environment, jinja_environment.get_env()))
+    try:
+        yield _scoped_environment.get()[1]
+    finally:
+        _scoped_environment.reset(token)
+
+
+def get_scoped_environment() -> Optional[Tuple[JinjaEnvironmentBlock, Environment]]:
+    """
+    Gets the block and the environment shared by the innermost active `jinja_environment_scope`.
+
+    Returns:
+        The block and its environment, or `None` outside of a scope.
+    """
+    return _scoped_environment.get()
@@ -0,0 +1,79 @@
+"""Command line interface of the collection."""
+import argparse
+from typing import List, Optional
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+
+
+def _compile(args: argparse.Namespace) -> None:
+    """
+    Compiles the templates of a `Jinja Environment` block, or of a search path, into `args.target`.
+
+    Args:
+        args: The parsed arguments of the `compile` command.
+    """
+    if args.block is not None:
+        block = JinjaEnvironmentBlock.load(args.block)
+    else:
+        block = JinjaEnvironmentBlock(search_path=args.search_path)
+    if args.enable_async is not None:
+        block = block.copy(update={"enable_async": args.enable_async})
+
+    block.compile_templates(args.target, zip=None if args.zip == "none" else args.zip)
+    mode = "async" if block.enable_async else "sync"
+    print(f"Compiled templates from {block.search_path!r} into {args.target!r} in {mode} mode.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the `prefect-jinja` command.
+
+    Args:
+        argv: The command line arguments. Defaults to `sys.argv`.
+
+    Example:
+        Precompile the templates of the `email-templates` block into a zip file:
+        ```bash
+        prefect-jinja compile templates.zip --block email-templates
+        ```
+
+        Precompile a directory of templates for blocks with `enable_async=False`:
+        ```bash
+        prefect-jinja compile templates.zip --search-path templates --sync
+        ```
+    """
+    parser = argparse.ArgumentParser(prog="prefect-jinja", description="Tools for prefect-jinja templates.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="Precompile a template tree for `JinjaEnvironmentBlock.compiled_path`."
+    )
+    compile_parser.add_argument("target", help="Path of the zip file or directory to write.")
+    source = compile_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--search-path", help="Directory that contains the templates.")
+    source.add_argument("--block", help="Name of a saved Jinja Environment block.")
+    compile_parser.add_argument(
+        "--zip",
+        choices=["deflated", "stored", "none"],
+        default="deflated",
+        help="Compression of the zip file, or `none` to write a directory.",
+    )
+    mode = compile_parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--async",
+        dest="enable_async",
+        action="store_const",
+        const=True,
+        help="Compile for blocks with `enable_async` set. Defaults to the setting of the block.",
+    )
+    mode.add_argument(
+        "--sync", dest="enable_async", action="store_const", const=False, help="Compile for blocks without async."
+    )
+    compile_parser.set_defaults(handler=_compile)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Jinja loaders used by the `Jinja Environment` block."""
+import hashlib
+import os
+import posixpath
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fsspec
+from jinja2 import BaseLoader, Environment, TemplateNotFound
+from jinja2.loaders import split_template_path
+
+VERSION_KEYS = ("ETag", "etag", "mtime", "LastModified", "last_modified", "created", "size")
+
+
+class ThrottledReloadLoader(BaseLoader):
+    """
+    Loader that wraps another loader and checks whether a loaded template changed at most once per interval,
+    instead of on every `get_template` call.
+
+    Args:
+        loader: The wrapped loader.
+        interval: Minimum number of seconds between two freshness checks of the same template.
+
+    Example:
+        ```python
+        from jinja2 import Environment, FileSystemLoader
+        from prefect_jinja.loaders import ThrottledReloadLoader
+        env = Environment(loader=ThrottledReloadLoader(FileSystemLoader("templates"), interval=30))
+        ```
+    """
+
+    def __init__(self, loader: BaseLoader, interval: float):
+        self.loader = loader
+        self.interval = interval
+        self.has_source_access = loader.has_source_access
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> Tuple[str, Optional[str], Optional[Callable[[], bool]]]:
+        """
+        Gets the source of a template from the wrapped loader, throttling its freshness check.
+
+        Args:
+            environment: The Jinja environment loading the template.
+            template: Name of the template.
+
+        Returns:
+            The source, the filename and the throttled freshness check of the template.
+        """
+        source, filename, uptodate = self.loader.get_source(environment, template)
+        if uptodate is None:
+            return source, filename, uptodate
+
+        return source, filename, self._throttle(uptodate)
+
+    def list_templates(self) -> List[str]:
+        """
+        Lists the templates of the wrapped loader.
+
+        Returns:
+            A list of template names.
+        """
+        return self.loader.list_templates()
+
+    def _throttle(self, uptodate: Callable[[], bool]) -> Callable[[], bool]:
+        """
+        Wraps a freshness check so it is only called once per interval.
+
+        Args:
+            uptodate: The freshness check of a template.
+
+        Returns:
+            A freshness check that reports the template as fresh until the interval has passed.
+        """
+        lock = threading.Lock()
+        last_check = time.monotonic()
+
+        def throttled_uptodate() -> bool:
+            """Calls the wrapped freshness check only if the interval has passed since the last call."""
+            nonlocal last_check
+            with lock:
+                now = time.monotonic()
+                if now - last_check < self.interval:
+                    return True
+                last_check = now
+            return uptodate()
+
+        return throttled_uptodate
+
+
+class FsspecLoader(BaseLoader):
+    """
+    Loader that reads templates from any filesystem supported by `fsspec`, such as S3, GCS or Azure object
+    storage, through a read-through cache.
+
+    Sources are kept in memory, and on disk if `cache_path` is set, along with the version of the remote file
+    (its ETag, modification time or size, depending on the filesystem). A cached source is reused as long as the
+    remote version is the same, and Jinja revalidates the version before reusing a compiled template when
+    `auto_reload` is enabled.
+
+    Args:
+        url: An `fsspec` URL of the directory that contains the templates, such as `s3://bucket/templates`.
+        cache_path: A local directory where fetched sources are cached across processes.
+        prefetch: Whether to fetch every template concurrently when the loader is created.
+        max_workers: Maximum number of concurrent fetches.
+        storage_options: Extra options passed to the `fsspec` filesystem, such as credentials.
+
+    Example:
+        ```python
+        from jinja2 import Environment
+        from prefect_jinja.loaders import FsspecLoader
+        env = Environment(loader=FsspecLoader("s3://bucket/templates", cache_path="/tmp/templates", prefetch=True))
+        ```
+    """
+
+    def __init__(
+        self,
+        url: str,
+        cache_path: Optional[str] = None,
+        prefetch: bool = False,
+        max_workers: int = 8,
+        storage_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.url = url
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.fs, self.root = fsspec.core.url_to_fs(url, **(storage_options or {}))
+        self._sources: Dict[str, Tuple[Any, str]] = {}
+        self._lock = threading.Lock()
+        if prefetch:
+            self.prefetch()
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, str, Callable[[], bool]]:
+        """
+        Gets the source of a template, fetching it only if its remote version changed.
+
+        Args:
+            environment: The Jinja environment loading the template.
+            template: Name of the template.
+
+        Raises:
+            TemplateNotFound: If the template does not exist.
+
+        Returns:
+            The source, the remote path and the freshness check of the template.
+        """
+        path = self._get_path(template)
+        try:
+            version = self._get_version(path)
+        except FileNotFoundError:
+            raise TemplateNotFound(template)
+        source = self._fetch(path, version)
+
+        def uptodate() -> bool:
+            """Reports whether the remote version of the template is still the one that was loaded."""
+            try:
+                return self._get_version(path) == version
+            except FileNotFoundError:
+                return False
+
+        return source, path, uptodate
+
+    def list_templates(self) -> List[str]:
+        """
+        Lists the templates found under the URL of the loader.
+
+        Returns:
+            A sorted list of template names.
+        """
+        prefix = self.root.rstrip("/") + "/"
+        return sorted(path[len(prefix):] for path in self.fs.find(self.root) if path.startswith(prefix))
+
+    def prefetch(self) -> None:
+        """Fetches every template concurrently, so later loads only revalidate their versions."""
+        paths = [self._get_path(template) for template in self.list_templates()]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda path: self._fetch(path, self._get_version(path)), paths))
+
+    def _get_path(self, template: str) -> str:
+        """
+        Builds the remote path of a template.
+
+        Args:
+            template: Name of the template.
+
+        Returns:
+            The path of the template in the filesystem.
+        """
+        return posixpath.join(self.root, *split_template_path(template))
+
+    def _get_version(self, path: str) -> Tuple[Any, ...]:
+        """
+        Gets the version of a remote file from its metadata.
+
+        Args:
+            path: The path of the file in the filesystem.
+
+        Returns:
+            A tuple with the ETag, modification time and size of the file, as available.
+        """
+        info = self.fs.info(path)
+        if info.get("type") == "directory":
+            raise FileNotFoundError(path)
+        return tuple(str(info[key]) for key in VERSION_KEYS if key in info)
+
+    def _fetch(self, path: str, version: Tuple[Any, ...]) -> str:
+        """
+        Gets the source of a remote file from the memory cache, the disk cache or the filesystem, in this order.
+
+        Args:
+            path: The path of the file in the filesystem.
+            version: The current version of the file.
+
+        Returns:
+            The source of the file.
+        """
+        with self._lock:
+            cached = self._sources.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        cache_file = None
+        if self.cache_path is not None:
+            key = hashlib.sha256(repr((self.fs.protocol, path, version)).encode("utf-8")).hexdigest()
+            cache_file = os.path.join(self.cache_path, key)
+
+        if cache_file is not None and os.path.exists(cache_file):
+            with open(cache_file, "rb") as file:
+                data = file.read()
+        else:
+            data = self.fs.cat_file(path)
+            if cache_file is not None:
+                os.makedirs(self.cache_path, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.cache_path, prefix=".", suffix=".tmp")
+                with open(fd, "wb") as file:
+                    file.write(data)
+                os.replace(temp_path, cache_file)
+
+        source = data.decode("utf-8")
+        with self._lock:
+            self._sources[path] = (version, source)
+
+        return source
@@ -0,0 +1,213 @@
+"""Timing and size metrics of the renders performed by the tasks of the collection."""
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from prefect_jinja._cache import LRUCache
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_hooks: List[Callable[["RenderMetrics"], Any]] = []
+_summaries = LRUCache(maxsize=128)
+_summaries_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RenderMetrics:
+    """
+    Metrics of one render.
+
+    Args:
+        template: Name of the rendered template, or `<string>` for templates rendered from a string.
+        load_seconds: Seconds spent getting the environment and loading the template, compiling it on a miss.
+        cache_hit: Whether the compiled template was reused from a cache.
+        render_seconds: Seconds spent rendering the template.
+        output_bytes: Size of the rendered template, encoded in UTF-8.
+        flow_run_id: The id of the flow run the render belongs to, if any.
+    """
+
+    template: str
+    load_seconds: float
+    cache_hit: bool
+    render_seconds: float
+    output_bytes: int
+    flow_run_id: Optional[UUID] = None
+
+
+def add_metrics_hook(hook: Callable[[RenderMetrics], Any]) -> None:
+    """
+    Registers a callable that receives the `RenderMetrics` of every render performed in this process.
+
+    Args:
+        hook: A callable that receives the metrics of a render. It must be fast and must not raise.
+
+    Example:
+        ```python
+        from prefect_jinja.metrics import PrometheusMetrics, add_metrics_hook
+        metrics = PrometheusMetrics()
+        add_metrics_hook(metrics)
+        ```
+    """
+    _hooks.append(hook)
+
+
+def remove_metrics_hook(hook: Callable[[RenderMetrics], Any]) -> None:
+    """
+    Unregisters a callable registered with `add_metrics_hook`.
+
+    Args:
+        hook: The callable to unregister.
+    """
+    _hooks.remove(hook)
+
+
+def record_render(metrics: RenderMetrics) -> None:
+    """
+    Hands the metrics of a render to the registered hooks and adds them to the summary of its flow run.
+
+    Args:
+        metrics: The metrics of a render.
+    """
+    for hook in list(_hooks):
+        hook(metrics)
+
+    if metrics.flow_run_id is not None:
+        summary = _summaries.get_or_create(metrics.flow_run_id, dict)
+        with _summaries_lock:
+            totals = summary.setdefault(metrics.template, [0, 0, 0.0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += metrics.cache_hit
+            totals[2] += metrics.load_seconds
+            totals[3] += metrics.render_seconds
+            totals[4] += metrics.output_bytes
+
+
+def get_render_summary(flow_run_id: UUID) -> List[Dict[str, Any]]:
+    """
+    Summarizes, per template, the renders recorded for a flow run in this process.
+
+    Args:
+        flow_run_id: The id of the flow run.
+
+    Returns:
+        A list of rows, one per template, with the number of renders, the cache hit ratio, the mean load and
+        render times in milliseconds and the total output bytes, slowest templates first.
+    """
+    summary = _summaries.get_or_create(flow_run_id, dict)
+    with _summaries_lock:
+        rows = [
+            {
+                "template": template,
+                "renders": count,
+                "cache_hit_ratio": round(hits / count, 3),
+                "mean_load_ms": round(load_seconds / count * 1000, 3),
+                "mean_render_ms": round(render_seconds / count * 1000, 3),
+                "output_bytes": output_bytes,
+            }
+            for template, (count, hits, load_seconds, render_seconds, output_bytes) in summary.items()
+        ]
+
+    return sorted(rows, key=lambda row: row["mean_render_ms"] * row["renders"], reverse=True)
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes a label value for the Prometheus text exposition format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The value with backslashes, double quotes and line feeds escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusMetrics:
+    """
+    A metrics hook that aggregates renders into Prometheus-style counters and histograms, labelled by template.
+    It needs no Prometheus server or client library: `expose` returns the text exposition format, which can be
+    served or pushed by any means.
+
+    Args:
+        buckets: Upper bounds, in seconds, of the buckets of the load and render time histograms.
+
+    Example:
+        ```python
+        from prefect_jinja.metrics import PrometheusMetrics, add_metrics_hook
+        metrics = PrometheusMetrics()
+        add_metrics_hook(metrics)
+        # ... renders ...
+        print(metrics.expose())
+        ```
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.renders: Dict[Tuple[str, str], int] = {}
+        self.output_bytes: Dict[str, int] = {}
+        self.histograms: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: RenderMetrics) -> None:
+        """
+        Counts a render and adds its load and render times to the histograms of its template.
+
+        Args:
+            metrics: The metrics of a render.
+        """
+        cache = "hit" if metrics.cache_hit else "miss"
+        with self._lock:
+            key = (metrics.template, cache)
+            self.renders[key] = self.renders.get(key, 0) + 1
+            self.output_bytes[metrics.template] = self.output_bytes.get(metrics.template, 0) + metrics.output_bytes
+            self._observe("load", metrics.template, metrics.load_seconds)
+            self._observe("render", metrics.template, metrics.render_seconds)
+
+    def _observe(self, stage: str, template: str, seconds: float) -> None:
+        """
+        Adds an observation to a histogram, stored as bucket counts followed by the sum of the observations.
+
+        Args:
+            stage: Either `load` or `render`.
+            template: Name of the template.
+            seconds: The observed duration.
+        """
+        histogram = self.histograms.setdefault((stage, template), [0.0] * (len(self.buckets) + 2))
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def expose(self) -> str:
+        """
+        Formats the metrics in the Prometheus text exposition format, escaping the template names in labels.
+
+        Returns:
+            The metrics, one sample per line.
+        """
+        lines = ["# TYPE prefect_jinja_renders_total counter"]
+        with self._lock:
+            for (template, cache), count in sorted(self.renders.items()):
+                template = _escape_label(template)
+                lines.append(f'prefect_jinja_renders_total{{template="{template}",cache="{cache}"}} {count}')
+            lines.append("# TYPE prefect_jinja_output_bytes_total counter")
+            for template, output_bytes in sorted(self.output_bytes.items()):
+                template = _escape_label(template)
+                lines.append(f'prefect_jinja_output_bytes_total{{template="{template}"}} {output_bytes}')
+            for stage in ("load", "render"):
+                name = f"prefect_jinja_{stage}_seconds"
+                lines.append(f"# TYPE {name} histogram")
+                for (histogram_stage, template), histogram in sorted(self.histograms.items()):
+                    if histogram_stage != stage:
+                        continue
+                    template = _escape_label(template)
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + (float("inf"),), histogram[:-1]):
+                        cumulative += int(count)
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{name}_bucket{{template="{template}",le="{le}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{template="{template}"}} {histogram[-1]}')
+                    lines.append(f'{name}_count{{template="{template}"}} {cumulative}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,227 @@
+"""Profiling of the time spent on each line of a template while it renders."""
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LineProfile:
+    """
+    Time spent on one line of a template.
+
+    Args:
+        template: Name of the template, or `None` for templates rendered from a string.
+        lineno: Line number in the template source.
+        function: The compiled function the line belongs to: `root`, `block_<name>` or `macro`.
+        hits: Number of times Python statements generated for the line were executed.
+        seconds: Wall time spent on the line, including the blocks, macros and templates it calls.
+        source: The source of the line, if available.
+    """
+
+    template: Optional[str]
+    lineno: int
+    function: str
+    hits: int
+    seconds: float
+    source: Optional[str] = None
+
+
+class TemplateProfiler:
+    """
+    Attributes wall time to the source lines of the templates rendered while it is active, using the line mapping
+    Jinja keeps in compiled templates. Only the current thread is traced, and the time of a line includes the
+    blocks, macros and included templates it calls.
+
+    !!! warning
+        Tracing slows rendering down considerably, and renders running concurrently in the same event loop are
+        profiled together. Use it to find hot spots, not to measure absolute latency.
+
+    Example:
+        ```python
+        from prefect_jinja.profiling import TemplateProfiler
+        profiler = TemplateProfiler()
+        with profiler:
+            template.render(rows=rows)
+        print(profiler.format_report())
+        ```
+    """
+
+    def __init__(self):
+        self._stats: Dict[Tuple[Optional[str], int, str], List[float]] = {}
+        self._environments: Dict[Optional[str], Any] = {}
+        self._debug_info: Dict[Any, List[Tuple[int, int]]] = {}
+        self._pending: Dict[FrameType, Tuple[int, float]] = {}
+        self._previous_trace: Optional[Callable] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "TemplateProfiler":
+        """
+        Starts tracing the current thread, on top of any trace function already set.
+
+        Returns:
+            The profiler.
+        """
+        self._previous_trace = sys.gettrace()
+        sys.settrace(self._trace)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Restores the previous trace function and accounts for the lines still running.
+
+        Args:
+            *exc_info: The exception raised in the `with` block, if any, which is not suppressed.
+        """
+        sys.settrace(self._previous_trace)
+        now = time.perf_counter()
+        for frame, (lineno, started) in list(self._pending.items()):
+            self._add(frame, lineno, now - started)
+        self._pending.clear()
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls a function with the profiler active, such as `template.render` in a worker thread.
+
+        Args:
+            func: The function to call.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        with self:
+            return func(*args, **kwargs)
+
+    def report(self) -> List[LineProfile]:
+        """
+        Builds the profile of every template line executed while the profiler was active.
+
+        Returns:
+            A list of line profiles, slowest lines first.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        profiles = [
+            LineProfile(template, lineno, function, int(hits), seconds, self._get_source_line(template, lineno))
+            for (template, lineno, function), (hits, seconds) in stats.items()
+        ]
+        return sorted(profiles, key=lambda profile: profile.seconds, reverse=True)
+
+    def format_report(self, limit: Optional[int] = 20) -> str:
+        """
+        Formats the slowest template lines as a text table.
+
+        Args:
+            limit: Maximum number of lines in the report, or `None` for all of them.
+
+        Returns:
+            The report, one template line per row.
+        """
+        rows = ["      ms     hits  location                        source"]
+        for profile in self.report()[:limit]:
+            location = f"{profile.template or '<string>'}:{profile.lineno} ({profile.function})"
+            source = (profile.source or "").strip()
+            rows.append(f"{profile.seconds * 1000:8.3f} {profile.hits:8d}  {location:<30.30}  {source:.60}")
+
+        return "\n".join(rows)
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Optional[Callable]:
+        """
+        Global trace function, which starts tracing the lines of frames that run compiled template code.
+
+        Args:
+            frame: The frame being called.
+            event: The trace event.
+            arg: The argument of the event.
+
+        Returns:
+            The local trace function for template frames, otherwise `None`.
+        """
+        if event == "call" and "debug_info" in frame.f_globals and "environment" in frame.f_globals:
+            return self._trace_lines
+        return None
+
+    def _trace_lines(self, frame: FrameType, event: str, arg: Any) -> Optional[Callable]:
+        """
+        Local trace function of template frames, which attributes the time since the previous event of the frame
+        to the template line of that event.
+
+        Args:
+            frame: The template frame.
+            event: The trace event.
+            arg: The argument of the event.
+
+        Returns:
+            Itself, to keep tracing the frame.
+        """
+        now = time.perf_counter()
+        pending = self._pending.pop(frame, None)
+        if pending is not None:
+            self._add(frame, pending[0], now - pending[1])
+        if event == "line":
+            self._pending[frame] = (frame.f_lineno, time.perf_counter())
+        return self._trace_lines
+
+    def _add(self, frame: FrameType, python_lineno: int, seconds: float) -> None:
+        """
+        Adds the time spent on a line of compiled template code to its template line.
+
+        Args:
+            frame: The template frame.
+            python_lineno: The line number in the compiled code.
+            seconds: The time spent on the line.
+        """
+        template = frame.f_globals.get("name")
+        key = (template, self._get_template_lineno(frame.f_globals, python_lineno), frame.f_code.co_name)
+        with self._lock:
+            self._environments.setdefault(template, frame.f_globals.get("environment"))
+            stats = self._stats.setdefault(key, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+
+    def _get_template_lineno(self, namespace: Dict[str, Any], python_lineno: int) -> int:
+        """
+        Maps a line of compiled template code to the line of the template source, like
+        `Template.get_corresponding_lineno`.
+
+        Args:
+            namespace: The globals of the compiled template.
+            python_lineno: The line number in the compiled code.
+
+        Returns:
+            The line number in the template source.
+        """
+        debug_info = namespace["debug_info"]
+        mapping = self._debug_info.get(debug_info)
+        if mapping is None:
+            mapping = [tuple(map(int, pair.split("="))) for pair in debug_info.split("&") if pair]
+            self._debug_info[debug_info] = mapping
+        for template_lineno, code_lineno in reversed(mapping):
+            if code_lineno <= python_lineno:
+                return template_lineno
+        return 1
+
+    def _get_source_line(self, template: Optional[str], lineno: int) -> Optional[str]:
+        """
+        Gets a line of the source of a template from the loader of its environment.
+
+        Args:
+            template: Name of the template.
+            lineno: Line number in the template source.
+
+        Returns:
+            The source line, or `None` if the source is not available.
+        """
+        env = self._environments.get(template)
+        if template is None or env is None or env.loader is None or not env.loader.has_source_access:
+            return None
+        try:
+            lines = env.loader.get_source(env, template)[0].splitlines()
+        except Exception:
+            return None
+        return lines[lineno - 1] if 0 < lineno <= len(lines) else None
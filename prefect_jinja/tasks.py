@@ -1,37 +1,514 @@
 """Tasks for rendering Jinja Templates."""
-from typing import Dict, Union
+import asyncio
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import stat
+import time
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+)
+from uuid import UUID, uuid4
 
-from jinja2 import Template
-from prefect import task
+import anyio
+from jinja2 import Environment, Template, UndefinedError
+from prefect import get_run_logger, task
+from prefect.artifacts import create_table_artifact
 from prefect.context import get_run_context, FlowRunContext, TaskRunContext
+from prefect.utilities.hashing import hash_objects
+from pydantic import BaseModel
 
-from prefect_jinja.blocks import JinjaEnvironmentBlock
+from prefect_jinja._analysis import (
+    get_required_variables,
+    get_template_sources,
+    get_template_variables,
+)
+from prefect_jinja._cache import CacheInfo, LRUCache
+from prefect_jinja._pool import render_in_processes, shutdown_pool
+from prefect_jinja.blocks import JinjaEnvironmentBlock, get_scoped_environment
+from prefect_jinja.metrics import RenderMetrics, get_render_summary, record_render
+from prefect_jinja.profiling import TemplateProfiler
+
+TEMPLATE_CACHE_SIZE = 256
+STREAM_BUFFER_SIZE = 64 * 1024
+RENDER_CHUNK_SIZE = 1000
+
+_template_cache = LRUCache(maxsize=TEMPLATE_CACHE_SIZE)
+_loaded_templates: "weakref.WeakSet[Template]" = weakref.WeakSet()
+
+
+def clear_template_cache() -> None:
+    """
+    Discards every template compiled by `jinja_render_from_string` and resets the cache statistics.
+
+    Example:
+        ```python
+        from prefect_jinja.tasks import clear_template_cache
+        clear_template_cache()
+        ```
+    """
+    _template_cache.clear()
+
+
+def template_cache_info() -> CacheInfo:
+    """
+    Reports the statistics of the cache of templates compiled by `jinja_render_from_string`.
+
+    Returns:
+        A named tuple with the `hits`, `misses`, `maxsize` and `currsize` of the cache.
+
+    Example:
+        ```python
+        from prefect_jinja.tasks import template_cache_info
+        print(template_cache_info().hits)
+        ```
+    """
+    return _template_cache.info()
+
+
+def shutdown_render_pool() -> None:
+    """
+    Shuts down every pool of worker processes kept warm by `jinja_render_many` with `processes`, waiting for their
+    pending renders. The next render in processes starts a new pool.
+
+    Example:
+        ```python
+        from prefect_jinja.tasks import shutdown_render_pool
+        shutdown_render_pool()
+        ```
+    """
+    shutdown_pool()
+
+
+def _get_template_from_string(template_string: str) -> Tuple[Template, bool]:
+    """
+    Compiles a template from a string, reusing the template compiled before for the same source.
+
+    Args:
+        template_string: A string representing a template.
+
+    Returns:
+        A compiled Jinja template, and whether it was reused from the cache.
+    """
+    options = {"enable_async": True}
+    key = (hashlib.sha256(template_string.encode("utf-8")).hexdigest(), tuple(sorted(options.items())))
+    cache_hit = key in _template_cache
+
+    return _template_cache.get_or_create(key, lambda: Template(template_string, **options)), cache_hit
+
+
+def _get_environment(
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+) -> Tuple[JinjaEnvironmentBlock, Environment]:
+    """
+    Gets the environment of a block, or the block and environment shared by `jinja_environment_scope` when no
+    block is given.
+
+    Args:
+        jinja_environment: A Jinja Environment block, or `None` to use the active scope.
+
+    Raises:
+        RuntimeError: If no block is given outside of a `jinja_environment_scope`.
+
+    Returns:
+        The block and its Jinja environment.
+    """
+    if jinja_environment is not None:
+        return jinja_environment, jinja_environment.get_env()
+
+    scoped = get_scoped_environment()
+    if scoped is None:
+        raise RuntimeError("No Jinja Environment block was given and no `jinja_environment_scope` is active.")
+    return scoped
+
+
+def _load_template(jinja_env: Environment, name: str) -> Tuple[Template, bool]:
+    """
+    Loads a template from a Jinja environment.
+
+    Args:
+        jinja_env: A Jinja environment.
+        name: Name of template file to load.
+
+    Returns:
+        A compiled Jinja template, and whether this process loaded the same compiled template before.
+    """
+    template = jinja_env.get_template(name)
+    cache_hit = template in _loaded_templates
+    _loaded_templates.add(template)
+
+    return template, cache_hit
+
+
+def _get_encoded_size(text: str) -> int:
+    """
+    Counts the bytes of a string encoded in UTF-8, without encoding the whole string at once.
+
+    Args:
+        text: The string to measure.
+
+    Returns:
+        The size of the string in UTF-8, in bytes.
+    """
+    if text.isascii():
+        return len(text)
+    return sum(
+        len(text[start : start + STREAM_BUFFER_SIZE].encode("utf-8"))
+        for start in range(0, len(text), STREAM_BUFFER_SIZE)
+    )
+
+
+def _record_render(
+    context: TaskRunContext, template: str, load_seconds: float, cache_hit: bool, render_seconds: float, output: str
+) -> None:
+    """
+    Records the metrics of a render and logs them at debug level.
+
+    Args:
+        context: The context of the task run that rendered the template.
+        template: Name of the rendered template.
+        load_seconds: Seconds spent loading the template.
+        cache_hit: Whether the compiled template was reused from a cache.
+        render_seconds: Seconds spent rendering the template.
+        output: The rendered template.
+    """
+    metrics = RenderMetrics(
+        template=template,
+        load_seconds=load_seconds,
+        cache_hit=cache_hit,
+        render_seconds=render_seconds,
+        output_bytes=_get_encoded_size(output),
+        flow_run_id=context.task_run.flow_run_id,
+    )
+    record_render(metrics)
+    get_run_logger().debug(
+        "Rendered template %r: load %.3f ms (cache %s), render %.3f ms, %d bytes.",
+        metrics.template,
+        metrics.load_seconds * 1000,
+        "hit" if metrics.cache_hit else "miss",
+        metrics.render_seconds * 1000,
+        metrics.output_bytes,
+    )
+
+
+def jinja_render_cache_key(context: TaskRunContext, parameters: Dict[str, Any]) -> Optional[str]:
+    """
+    A Prefect `cache_key_fn` for `jinja_render_from_template` and `jinja_render_from_string` that hashes the source
+    of the rendered template, including the templates it extends, includes or imports, the settings of the
+    `Jinja Environment` block, such as its namespace, and the keywords of the render.
+
+    !!! note Context
+        The task run context is not part of the key, so cached renders of templates that use `context` keep the
+        context of the run that rendered them.
+
+    !!! note Compiled templates
+        Templates loaded from `compiled_path` have no source, so they are keyed by name.
+
+    !!! note Dynamic references
+        Templates that extend, include or import a template computed at render time, such as
+        `{% include name %}`, are not cached, since the referenced template is unknown until the render.
+
+    Args:
+        context: The context of the task run.
+        parameters: The parameters of the task run.
+
+    Returns:
+        The cache key, or `None` if the parameters can not be hashed or the template has dynamic references.
+
+    Examples:
+        Cache the renders of a welcome template for one day:
+        ```python
+        from datetime import timedelta
+        from prefect_jinja.tasks import jinja_render_cache_key
+
+        cached_render = jinja_render_from_template.with_options(
+            cache_key_fn=jinja_render_cache_key, cache_expiration=timedelta(days=1)
+        )
+        ```
+    """
+    parameters = dict(parameters)
+    if "template_string" in parameters:
+        sources = {None: parameters.pop("template_string")}
+        settings = None
+    else:
+        jinja_environment, jinja_env = _get_environment(parameters.pop("jinja_environment", None))
+        name = parameters.pop("name")
+        if jinja_env.loader.has_source_access:
+            sources = get_template_sources(jinja_env, name)
+            if sources is None:
+                return None
+        else:
+            sources = {name: None}
+        settings = jinja_environment._env_cache_key()[1:]
+
+    return hash_objects(context.task.task_key, sorted(sources.items(), key=str), settings, parameters)
+
+
+class _LazyModelDict(Mapping[str, Any]):
+    """
+    A read-only mapping over the fields of a pydantic model that converts a field to its `dict()` representation
+    only when the field is accessed, so templates that never use the model cost nothing to render.
+
+    Args:
+        model: The pydantic model to expose.
+    """
+
+    def __init__(self, model: BaseModel):
+        self._model = model
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Converts the field `key` of the model on first access, and returns the converted value."""
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._model.__fields__:
+                raise
+        value = self._model.dict(include={key})[key]
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the names of the fields of the model."""
+        return iter(self._model.__fields__)
+
+    def __len__(self) -> int:
+        """Returns the number of fields of the model."""
+        return len(self._model.__fields__)
+
+    def __repr__(self) -> str:
+        """Returns the repr of the converted dict, as rendered by templates that print the whole mapping."""
+        return repr(dict(self))
 
 
 def _get_template_context(context: Union[FlowRunContext, TaskRunContext]) -> Dict:
     """
     Transforms the context of a running task into a dict to make it available in the template.
 
+    The fields of the task run are only converted when a template accesses them.
+
     Args:
         context: The current run context of a task or flow function.
 
     Returns:
         A dict of `TaskRunContext`.
     """
-    return {"context": context.task_run.dict()}
+    return {"context": _LazyModelDict(context.task_run)}
+
+
+def _check_variables(
+    jinja_environment: JinjaEnvironmentBlock, template: Template, variables: Mapping[str, Any]
+) -> None:
+    """
+    Checks that every variable used by a template is provided, when the block has `strict_variables` enabled.
+
+    Args:
+        jinja_environment: The Jinja Environment block the template was loaded from.
+        template: A template loaded from the block.
+        variables: The variables available in the template.
+
+    Raises:
+        UndefinedError: If a variable used by the template is neither provided nor a global of the environment.
+    """
+    if not jinja_environment.strict_variables:
+        return
+
+    required = get_required_variables(template)
+    if required is None:
+        return
+    missing = required.difference(variables, template.globals)
+    if missing:
+        raise UndefinedError(f"Template {template.name!r} is missing variables: {', '.join(sorted(missing))}.")
+
+
+def _prune_variables(template: Template, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drops the variables a template does not use, so they are not shipped to other processes.
+
+    Args:
+        template: A template loaded from an environment.
+        variables: The variables available in the template.
+
+    Returns:
+        The variables used by the template, or all of them if they can not be known statically.
+    """
+    used = get_template_variables(template)
+    if used is None:
+        return variables
+
+    return {key: value for key, value in variables.items() if key in used}
+
+
+async def _render(
+    template: Template, variables: Dict[str, Any], profiler: Optional[TemplateProfiler] = None
+) -> str:
+    """
+    Renders a template, offloading the render of templates from non-async environments to a worker thread.
+
+    Args:
+        template: A compiled Jinja template.
+        variables: The variables available in the template.
+        profiler: A profiler to activate while the template renders.
+
+    Returns:
+        A string containing the rendered template.
+    """
+    if template.environment.is_async:
+        if profiler is None:
+            return await template.render_async(variables)
+        with profiler:
+            return await template.render_async(variables)
+
+    if profiler is None:
+        return await anyio.to_thread.run_sync(template.render, variables)
+    return await anyio.to_thread.run_sync(profiler.run, template.render, variables)
+
+
+async def _iter_template_chunks(
+    template: Template, variables: Dict[str, Any], buffer_size: int
+) -> AsyncIterator[str]:
+    """
+    Renders a template piece by piece, grouping the pieces generated by Jinja into chunks. The pieces of templates
+    from non-async environments are generated in a worker thread.
+
+    Args:
+        template: A compiled Jinja template.
+        variables: The variables available in the template.
+        buffer_size: Number of characters buffered before a chunk is yielded.
+
+    Yields:
+        Chunks of the rendered template, of about `buffer_size` characters each.
+    """
+    if not template.environment.is_async:
+        pieces = template.generate(variables)
+
+        def next_chunk() -> str:
+            """Renders pieces of the template until `buffer_size` characters are buffered, or the end is reached."""
+            buffer = []
+            buffered = 0
+            for piece in pieces:
+                buffer.append(piece)
+                buffered += len(piece)
+                if buffered >= buffer_size:
+                    break
+            return "".join(buffer)
+
+        chunk = await anyio.to_thread.run_sync(next_chunk)
+        while chunk:
+            yield chunk
+            chunk = await anyio.to_thread.run_sync(next_chunk)
+        return
+
+    buffer: List[str] = []
+    buffered = 0
+    async for piece in template.generate_async(variables):
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= buffer_size:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _create_temp_file(path: str) -> Tuple[int, str]:
+    """
+    Creates a temporary file next to `path`, creating missing directories. Unlike `tempfile.mkstemp`, the file is
+    created with the default mode of new files under the current umask, applied by the operating system.
+
+    Args:
+        path: Path of the file the temporary file will replace.
+
+    Returns:
+        The file descriptor, open for writing, and the path of the temporary file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    while True:
+        temp_path = os.path.join(directory, f".{uuid4().hex}.tmp")
+        try:
+            return os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def _replace_file(temp_path: str, path: str) -> None:
+    """
+    Atomically renames a temporary file created by `_create_temp_file` to `path`, keeping the mode of the file it
+    replaces, if any.
+
+    Args:
+        temp_path: Path of the temporary file.
+        path: Path of the file to write.
+    """
+    try:
+        os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+    except FileNotFoundError:
+        pass
+    os.replace(temp_path, path)
+
+
+async def _write_template_to_file(
+    template: Template, variables: Dict[str, Any], path: str, buffer_size: int, encoding: str
+) -> int:
+    """
+    Renders a template into a temporary file next to `path` and atomically renames it to `path`.
+
+    Args:
+        template: A compiled Jinja template.
+        variables: The variables available in the template.
+        path: Path of the file to write.
+        buffer_size: Size, in bytes, of the write buffer.
+        encoding: Encoding of the written file.
+
+    Returns:
+        The number of bytes written.
+    """
+    fd, temp_path = _create_temp_file(path)
+    written = 0
+    try:
+        with open(fd, "wb", buffering=buffer_size) as file:
+            async for chunk in _iter_template_chunks(template, variables, buffer_size):
+                written += file.write(chunk.encode(encoding))
+        _replace_file(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    return written
 
 
 @task
-async def jinja_render_from_template(name: str, jinja_environment: JinjaEnvironmentBlock, **kwargs) -> str:
+async def jinja_render_from_template(
+    name: str, jinja_environment: Optional[JinjaEnvironmentBlock] = None, **kwargs
+) -> str:
     """
     Task that performs the rendering of a template file based on settings of a `Jinja Environment` block.
 
     !!! note Context
         The context of a task will be available in the template via `context` keyword.
 
+    !!! note Profiling
+        When the block has `profile` enabled, the time spent on each template line is logged after the render.
+
     Args:
         name: Name of template file to render.
-        jinja_environment: A Jinja Environment block.
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
         **kwargs (dict): Keywords that will be available as variables in the template.
 
     Raises:
@@ -62,11 +539,530 @@ async def jinja_render_from_template(name: str, jinja_environment: JinjaEnvironm
         ```
     """
     context = get_run_context()
-    jinja_env = jinja_environment.get_env()
 
-    template = jinja_env.get_template(name, globals=_get_template_context(context))
+    start = time.perf_counter()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+    template, cache_hit = _load_template(jinja_env, name)
+    load_seconds = time.perf_counter() - start
+    variables = {**_get_template_context(context), **kwargs}
+    _check_variables(jinja_environment, template, variables)
+
+    profiler = TemplateProfiler() if jinja_environment.profile else None
+    start = time.perf_counter()
+    rendered = await _render(template, variables, profiler)
+    _record_render(context, name, load_seconds, cache_hit, time.perf_counter() - start, rendered)
+    if profiler is not None:
+        get_run_logger().info("Profile of template %r:\n%s", name, profiler.format_report())
+
+    return rendered
+
+
+@task
+async def jinja_stream_from_template(
+    name: str,
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+    writer: Union[Callable[[str], Any], Any],
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    **kwargs,
+) -> int:
+    """
+    Task that renders a template file in chunks and hands each chunk to a writer, so the whole output is never
+    held in memory.
+
+    !!! note Context
+        The context of a task will be available in the template via `context` keyword.
+
+    Args:
+        name: Name of template file to render.
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
+        writer: A file-like object with a `write` method, or a callable, that receives each chunk. If it returns
+            an awaitable, it is awaited before the next chunk is rendered.
+        buffer_size: Number of characters buffered before a chunk is written.
+        **kwargs (dict): Keywords that will be available as variables in the template.
+
+    Raises:
+        TemplateNotFound: If the template file does not exist.
+        TemplateSyntaxError: If there is a problem with the template.
+
+    Returns:
+        The number of characters written.
+
+    Examples:
+        Stream a report template into a file:
+        ```python
+        @flow
+        def write_report_flow(rows: List[Dict]):
+            jinja_environment = JinjaEnvironmentBlock(search_path="templates")
+            with open("report.html", "w") as report:
+                return jinja_stream_from_template("report.html", jinja_environment, report, rows=rows)
+        print(write_report_flow(rows=[{"name": "Neymar"}]))
+        ```
+    """
+    context = get_run_context()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+
+    template = jinja_env.get_template(name)
+    variables = {**_get_template_context(context), **kwargs}
+    _check_variables(jinja_environment, template, variables)
+
+    write = getattr(writer, "write", writer)
+    written = 0
+    async for chunk in _iter_template_chunks(template, variables, buffer_size):
+        result = write(chunk)
+        if inspect.isawaitable(result):
+            await result
+        written += len(chunk)
+
+    return written
+
+
+@task
+async def jinja_render_to_file(
+    name: str,
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+    path: str,
+    buffer_size: int = STREAM_BUFFER_SIZE,
+    encoding: str = "utf-8",
+    **kwargs,
+) -> Tuple[str, int]:
+    """
+    Task that renders a template file straight into a file on disk. The output is streamed into a temporary file
+    that is atomically renamed to `path` once complete, so readers never see a partial file.
+
+    !!! note Context
+        The context of a task will be available in the template via `context` keyword.
+
+    Args:
+        name: Name of template file to render.
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
+        path: Path of the file to write. Missing directories are created.
+        buffer_size: Size, in bytes, of the write buffer.
+        encoding: Encoding of the written file.
+        **kwargs (dict): Keywords that will be available as variables in the template.
+
+    Raises:
+        TemplateNotFound: If the template file does not exist.
+        TemplateSyntaxError: If there is a problem with the template.
+
+    Returns:
+        A tuple with the path of the written file and the number of bytes written.
+
+    Examples:
+        Render a report template file into `reports/report.html`:
+        ```python
+        @flow
+        def write_report_flow(rows: List[Dict]):
+            jinja_environment = JinjaEnvironmentBlock(search_path="templates")
+            return jinja_render_to_file("report.html", jinja_environment, "reports/report.html", rows=rows)
+        print(write_report_flow(rows=[{"name": "Neymar"}]))
+        ```
+    """
+    context = get_run_context()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+
+    template = jinja_env.get_template(name)
+    variables = {**_get_template_context(context), **kwargs}
+    _check_variables(jinja_environment, template, variables)
+    written = await _write_template_to_file(template, variables, path, buffer_size, encoding)
+
+    return path, written
+
+
+@task
+async def jinja_render_outdated(
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+    output_path: str,
+    hashes_path: str,
+    names: Optional[List[str]] = None,
+    **kwargs,
+) -> List[str]:
+    """
+    Task that renders into files only the templates whose source, or the source of a template they extend,
+    include or import, changed since the last run. The hashes of the templates are persisted in `hashes_path`
+    after every successful run; on the first run, every template is rendered.
+
+    !!! note Context
+        The context of a task will be available in the template via `context` keyword.
+
+    Args:
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
+        output_path: Directory where each template is rendered, under the same name.
+        hashes_path: Path of the JSON file that stores the hashes of the templates between runs.
+        names: Names of the templates to render, such as pages, leaving out the templates they are built from.
+            Defaults to every template of the environment.
+        **kwargs (dict): Keywords that will be available as variables in the templates.
+
+    Raises:
+        TemplateNotFound: If a template does not exist.
+        TemplateSyntaxError: If there is a problem with a template.
+
+    Returns:
+        A sorted list with the names of the rendered templates.
+
+    Examples:
+        Re-render the pages of a static site whose templates changed:
+        ```python
+        @flow
+        def build_site_flow():
+            jinja_environment = JinjaEnvironmentBlock(search_path="templates")
+            return jinja_render_outdated(
+                jinja_environment, "site", "site/.template-hashes.json", names=["index.html", "about.html"]
+            )
+        print(build_site_flow())
+        ```
+    """
+    context = get_run_context()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+
+    previous_hashes: Dict[str, str] = {}
+    if os.path.exists(hashes_path):
+        with open(hashes_path) as file:
+            previous_hashes = json.load(file)
+    current_hashes = jinja_environment.get_template_hashes()
+    outdated = jinja_environment.get_outdated_templates(previous_hashes, current_hashes)
+    if names is not None:
+        outdated = [name for name in outdated if name in names]
+
+    variables = {**_get_template_context(context), **kwargs}
+    for name in outdated:
+        template = jinja_env.get_template(name)
+        _check_variables(jinja_environment, template, variables)
+        await _write_template_to_file(
+            template, variables, os.path.join(output_path, name), STREAM_BUFFER_SIZE, "utf-8"
+        )
+
+    fd, temp_path = _create_temp_file(hashes_path)
+    with open(fd, "w") as file:
+        json.dump(current_hashes, file, indent=2, sort_keys=True)
+    _replace_file(temp_path, hashes_path)
+
+    return outdated
+
+
+@task
+async def jinja_preload(
+    jinja_environment: JinjaEnvironmentBlock, names: Optional[List[str]] = None, max_workers: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Task that loads and compiles the templates of a `Jinja Environment` block into the environment cache of the
+    current process, logging the time spent on each template, so a worker can be warmed up before taking traffic.
+
+    Args:
+        jinja_environment: A Jinja Environment block.
+        names: Names of the templates to preload. Defaults to every template of the environment.
+        max_workers: Number of threads compiling templates in parallel. Defaults to compiling them one by one.
+
+    Raises:
+        TemplateNotFound: If a template does not exist.
+        TemplateSyntaxError: If there is a problem with a template.
+
+    Returns:
+        A dict mapping the name of each template to the seconds it took to load.
+
+    Examples:
+        Warm up the templates of a block before rendering:
+        ```python
+        @flow
+        def send_welcome_flow(usernames: List[str]):
+            jinja_environment = JinjaEnvironmentBlock.load("email-templates")
+            jinja_preload(jinja_environment, max_workers=4)
+            return jinja_render_many(
+                "welcome.html", jinja_environment, [{"username": username} for username in usernames]
+            )
+        ```
+    """
+    logger = get_run_logger()
+
+    timings = await anyio.to_thread.run_sync(jinja_environment.preload, names, max_workers)
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        logger.info("Preloaded template %r in %.2f ms.", name, seconds * 1000)
+
+    return timings
+
+
+@task
+async def jinja_render_metrics_artifact(key: Optional[str] = None) -> Optional[UUID]:
+    """
+    Task that publishes, as a table artifact of the flow run, a summary per template of the renders performed by
+    `jinja_render_from_template` and `jinja_render_from_string` in the current flow run and process.
+
+    Args:
+        key: The key of the artifact. Must contain only lowercase letters, numbers and dashes.
+
+    Returns:
+        The id of the artifact, or `None` if nothing was rendered.
+
+    Examples:
+        Summarize the renders of a flow:
+        ```python
+        @flow
+        def send_welcome_flow(usernames: List[str]):
+            jinja_environment = JinjaEnvironmentBlock.load("email-templates")
+            for username in usernames:
+                jinja_render_from_template("welcome.html", jinja_environment, username=username)
+            jinja_render_metrics_artifact(key="welcome-renders")
+        ```
+    """
+    context = get_run_context()
+
+    rows = get_render_summary(context.task_run.flow_run_id)
+    if not rows:
+        return None
+
+    return await create_table_artifact(rows, key=key, description="Render metrics per template.")
+
+
+async def _render_batch(template: Template, variables_list: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Renders a template once for each dict of variables, offloading the whole batch to a worker thread for
+    templates from non-async environments.
+
+    Args:
+        template: A compiled Jinja template.
+        variables_list: An iterable of dicts, each one holding the variables of one render.
+
+    Returns:
+        A list with the rendered templates.
+    """
+    if template.environment.is_async:
+        return [await template.render_async(variables) for variables in variables_list]
+
+    return await anyio.to_thread.run_sync(lambda: [template.render(variables) for variables in variables_list])
+
+
+@task
+async def jinja_render_from_table(
+    name: str,
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+    table: Any,
+    column: str = "rendered",
+    output_path: Optional[str] = None,
+    batch_size: int = 1024,
+) -> Any:
+    """
+    Task that renders a template file once for each row of a table, with the columns of the row as variables.
+    Rows are read batch by batch, so only the rows of one batch are converted to Python objects at a time.
+
+    Requires `pyarrow`, and `pandas` for DataFrames.
+
+    !!! note Context
+        The context of a task will be available in the template via `context` keyword.
+
+    Args:
+        name: Name of template file to render.
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
+        table: A `pyarrow.Table`, a `pandas.DataFrame`, a `pyarrow.parquet.ParquetFile`, read batch by batch,
+            or a list of `pyarrow.RecordBatch`. Prefect consumes iterators passed as task parameters, so pass
+            a `ParquetFile` rather than the iterator of its `iter_batches`.
+        column: Name of the column that receives the rendered templates.
+        output_path: Path of a Parquet file to write the table with the new column to, batch by batch. If not
+            set, the table with the new column is returned instead.
+        batch_size: Maximum number of rows rendered per batch.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+        TemplateNotFound: If the template file does not exist.
+        TemplateSyntaxError: If there is a problem with the template.
+
+    Returns:
+        The path of the Parquet file if `output_path` is set. Otherwise, a DataFrame for DataFrame inputs, or a
+        `pyarrow.Table`, with the rendered templates in `column`.
+
+    Examples:
+        Render a welcome email for each recipient of a Parquet file:
+        ```python
+        import pyarrow.parquet as pq
+
+        @flow
+        def send_welcome_flow():
+            jinja_environment = JinjaEnvironmentBlock(search_path="templates")
+            recipients = pq.ParquetFile("recipients.parquet")
+            return jinja_render_from_table(
+                "welcome.html", jinja_environment, recipients, output_path="welcome.parquet"
+            )
+        ```
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Rendering from tables requires `pyarrow`: pip install pyarrow") from exc
+
+    context = get_run_context()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+
+    template = jinja_env.get_template(name)
+    template_context = _get_template_context(context)
+
+    dataframe = None
+    if isinstance(table, pa.Table):
+        schema = table.schema
+        batches = iter(table.to_batches(max_chunksize=batch_size))
+    elif hasattr(table, "iloc"):
+        dataframe = table
+        schema = pa.Schema.from_pandas(dataframe, preserve_index=False)
+        batches = (
+            pa.RecordBatch.from_pandas(
+                dataframe.iloc[start : start + batch_size], schema=schema, preserve_index=False
+            )
+            for start in range(0, len(dataframe), batch_size)
+        )
+    elif hasattr(table, "iter_batches"):
+        schema = table.schema_arrow
+        batches = table.iter_batches(batch_size=batch_size)
+    else:
+        table = list(table)
+        schema = table[0].schema if table else pa.schema([])
+        batches = iter(table)
+    output_schema = schema.append(pa.field(column, pa.string()))
+
+    def iter_variables(batch: "pa.RecordBatch") -> Iterator[Dict[str, Any]]:
+        """Yields the render variables of each row of a batch, checked when `strict_variables` is enabled."""
+        columns = batch.to_pydict()
+        names = list(columns)
+        for values in zip(*columns.values()):
+            variables = dict(template_context)
+            variables.update(zip(names, values))
+            _check_variables(jinja_environment, template, variables)
+            yield variables
+
+    rendered_batches: List["pa.RecordBatch"] = []
+    writer = None
+    temp_path = None
+    if output_path is not None:
+        fd, temp_path = _create_temp_file(output_path)
+        os.close(fd)
+    try:
+        if temp_path is not None:
+            writer = pq.ParquetWriter(temp_path, output_schema)
+        for batch in batches:
+            rendered = await _render_batch(template, iter_variables(batch))
+            rendered_batch = pa.RecordBatch.from_arrays(
+                batch.columns + [pa.array(rendered, pa.string())], schema=output_schema
+            )
+            if writer is None:
+                rendered_batches.append(rendered_batch)
+            else:
+                writer.write_batch(rendered_batch)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        if temp_path is not None:
+            os.unlink(temp_path)
+        raise
+
+    if writer is not None:
+        writer.close()
+        _replace_file(temp_path, output_path)
+        return output_path
+
+    if dataframe is not None:
+        rendered_column = [value for batch in rendered_batches for value in batch.column(column).to_pylist()]
+        return dataframe.assign(**{column: rendered_column})
 
-    return await template.render_async(**kwargs)
+    return pa.Table.from_batches(rendered_batches, schema=output_schema)
+
+
+@task
+async def jinja_render_many(
+    name: str,
+    jinja_environment: Optional[JinjaEnvironmentBlock],
+    kwargs_list: Iterable[Dict[str, Any]],
+    max_concurrency: int = 10,
+    processes: Optional[int] = None,
+    chunk_size: int = RENDER_CHUNK_SIZE,
+) -> List[str]:
+    """
+    Task that renders a template file once for each dict of keywords, within a single task run. Use it instead
+    of mapping `jinja_render_from_template` over many inputs, which schedules one task run per render.
+
+    !!! note Chunks
+        Renders are started `chunk_size` at a time, so only the renders of one chunk are pending at once, and
+        progress is logged after each chunk.
+
+    !!! note Context
+        The context of a task will be available in the template via `context` keyword.
+
+    !!! note Processes
+        Rendering is CPU-bound, so by default all renders share one core. Set `processes` to fan renders out to a
+        pool of worker processes, each one holding a warm environment built from the block. The pool is kept
+        for the next calls with the same block settings and number of processes, alongside the pools of up to three
+        other settings, until `shutdown_render_pool` is called. The block and the keywords must then be picklable. Keywords the template does not use are not
+        sent to the workers.
+
+    Args:
+        name: Name of template file to render.
+        jinja_environment: A Jinja Environment block, or `None` to use the one of `jinja_environment_scope`.
+        kwargs_list: An iterable of dicts, each one holding the keywords of one render.
+        max_concurrency: Maximum number of renders awaited at the same time.
+        processes: Number of worker processes to render in. Defaults to rendering in the current process.
+        chunk_size: Number of renders started at a time in the current process.
+
+    Raises:
+        ValueError: If `max_concurrency` or `chunk_size` is lower than one.
+        TemplateNotFound: If the template file does not exist.
+        TemplateSyntaxError: If there is a problem with the template.
+
+    Returns:
+        A list with the rendered templates, in the same order as `kwargs_list`.
+
+    Examples:
+        Render a welcome template file for many users:
+        ```python
+        @flow
+        def send_welcome_flow(usernames: List[str]):
+            jinja_environment = JinjaEnvironmentBlock(search_path="templates")
+            return jinja_render_many(
+                "welcome.html",
+                jinja_environment,
+                [{"username": username} for username in usernames],
+            )
+        print(send_welcome_flow(usernames=["Neymar", "Robinho"]))
+        ```
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    context = get_run_context()
+    jinja_environment, jinja_env = _get_environment(jinja_environment)
+
+    template = jinja_env.get_template(name)
+    template_context = _get_template_context(context)
+
+    if processes is not None:
+        used = get_template_variables(template)
+        if used is None or "context" in used:
+            template_context = {"context": dict(template_context["context"])}
+        variables_list = []
+        for kwargs in kwargs_list:
+            variables = {**template_context, **kwargs}
+            _check_variables(jinja_environment, template, variables)
+            variables_list.append(_prune_variables(template, variables))
+        return await render_in_processes(jinja_environment, name, variables_list, processes)
+
+    logger = get_run_logger()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(kwargs_list) if isinstance(kwargs_list, Sized) else None
+
+    async def render(kwargs: Dict[str, Any]) -> str:
+        """Renders the template for one dict of keywords, at most `max_concurrency` at a time."""
+        variables = {**template_context, **kwargs}
+        _check_variables(jinja_environment, template, variables)
+        async with semaphore:
+            return await _render(template, variables)
+
+    results: List[str] = []
+    iterator = iter(kwargs_list)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            break
+        results.extend(await asyncio.gather(*(render(kwargs) for kwargs in chunk)))
+        logger.info("Rendered %d of %s renders of template %r.", len(results), total or "?", name)
+
+    return results
 
 
 @task
@@ -77,6 +1073,9 @@ async def jinja_render_from_string(template_string: str, **kwargs) -> str:
     !!! note Context
         The context of a task will be available in the template via `context` keyword.
 
+    !!! note Cache
+        Compiled templates are cached per process, so rendering the same string again skips compilation.
+
     Args:
         template_string: A string representing a template.
         **kwargs (dict): Keywords that will be available as variables in the template.
@@ -98,7 +1097,12 @@ async def jinja_render_from_string(template_string: str, **kwargs) -> str:
     """
     context = get_run_context()
 
-    template = Template(template_string, enable_async=True)
-    template.globals = _get_template_context(context)
+    start = time.perf_counter()
+    template, cache_hit = _get_template_from_string(template_string)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rendered = await template.render_async(_get_template_context(context), **kwargs)
+    _record_render(context, "<string>", load_seconds, cache_hit, time.perf_counter() - start, rendered)
 
-    return await template.render_async(**kwargs)
+    return rendered
@@ -27,6 +27,7 @@ setup(
     python_requires=">=3.7",
     install_requires=install_requires,
     extras_require={"dev": dev_requires},
+    entry_points={"console_scripts": ["prefect-jinja=prefect_jinja.cli:main"]},
     classifiers=[
         "Natural Language :: English",
         "Intended Audience :: Developers",
@@ -0,0 +1,98 @@
+from jinja2 import DictLoader, Environment
+
+from prefect_jinja._analysis import get_required_variables, get_template_variables
+
+
+def test_get_template_variables_follows_references():
+    env = Environment(
+        loader=DictLoader(
+            {
+                "base.txt": "{{ title }}{% block body %}{% endblock %}{% include 'footer.txt' %}",
+                "footer.txt": "{{ company }}",
+                "child.txt": (
+                    "{% extends 'base.txt' %}"
+                    "{% block body %}{% set greeting = 'Hi' %}{{ greeting }} {{ username }}{% endblock %}"
+                ),
+            }
+        )
+    )
+
+    template = env.get_template("child.txt")
+    assert get_template_variables(template) == {"title", "company", "username"}
+    assert get_template_variables(template) is get_template_variables(template)
+
+
+def test_get_template_variables_with_dynamic_reference():
+    env = Environment(loader=DictLoader({"page.txt": "{% include name %}"}))
+
+    assert get_template_variables(env.get_template("page.txt")) is None
+
+
+def test_get_required_variables_with_loop_variable_of_include():
+    env = Environment(
+        loader=DictLoader(
+            {
+                "table.txt": "{% for item in items %}{% include 'row.txt' %}{% endfor %}",
+                "row.txt": "{{ item }} {{ currency }}",
+            }
+        )
+    )
+
+    template = env.get_template("table.txt")
+    assert get_template_variables(template) == {"items", "item", "currency"}
+    assert get_required_variables(template) == {"items", "currency"}
+
+
+def test_get_required_variables_with_variable_set_before_extends():
+    env = Environment(
+        loader=DictLoader(
+            {
+                "base.txt": "<title>{{ title }}</title>{{ username }}",
+                "page.txt": "{% set title = 'Welcome' %}{% extends 'base.txt' %}",
+            }
+        )
+    )
+
+    assert get_required_variables(env.get_template("page.txt")) == {"username"}
+
+
+def test_get_required_variables_with_loop_variable_of_parent_in_scoped_block():
+    env = Environment(
+        loader=DictLoader(
+            {
+                "base.txt": "{% for item in items %}{% block row scoped %}{% endblock %}{% endfor %}",
+                "middle.txt": "{% extends 'base.txt' %}",
+                "page.txt": "{% extends 'middle.txt' %}{% block row %}{{ item }} {{ currency }}{% endblock %}",
+            }
+        )
+    )
+
+    template = env.get_template("page.txt")
+    assert template.render(items=[1, 2], currency="EUR") == "1 EUR2 EUR"
+    assert get_required_variables(template) == {"items", "currency"}
+
+
+def test_get_required_variables_with_optional_variables():
+    env = Environment(
+        loader=DictLoader(
+            {
+                "page.txt": (
+                    "{{ title|default('Home') }}"
+                    "{% if username is defined %}{{ username }}{% endif %}"
+                    "{% if footer is undefined %}-{% else %}{{ footer }}{% endif %}"
+                    "{{ company is defined }}{{ greeting|default(salutation) }}{{ user.name|default('') }}"
+                ),
+            }
+        )
+    )
+
+    template = env.get_template("page.txt")
+    assert template.render(salutation="Hi", user={}) == "Home-FalseHi"
+    assert get_template_variables(template) == {"title", "username", "footer", "company", "greeting", "salutation", "user"}
+    assert get_required_variables(template) == {"salutation", "user"}
+
+
+def test_get_required_variables_with_variable_used_outside_of_guard():
+    env = Environment(loader=DictLoader({"page.txt": "{{ title|default('Home') }} {{ title }}"}))
+
+    assert get_required_variables(env.get_template("page.txt")) == {"title"}
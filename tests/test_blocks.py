@@ -1,8 +1,41 @@
+import os
+import shlex
 from typing import Dict
 
-from jinja2 import Environment, FileSystemLoader
+import pytest
+from jinja2 import (
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    MemcachedBytecodeCache,
+    ModuleLoader,
+)
 
-from prefect_jinja.blocks import JinjaEnvironmentBlock
+from prefect_jinja.blocks import (
+    JinjaEnvironmentBlock,
+    clear_env_cache,
+    get_scoped_environment,
+    jinja_environment_scope,
+)
+from prefect_jinja.loaders import FsspecLoader, ThrottledReloadLoader
+
+
+class DictBytecodeClient:
+    """A key/value client standing in for Memcached or Redis."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+
+bytecode_client = DictBytecodeClient()
 
 
 class TestJinjaEnvironmentBlock:
@@ -27,4 +60,256 @@ class TestJinjaEnvironmentBlock:
         assert isinstance(jinja_env.loader, FileSystemLoader)
         assert "templates" in jinja_env.loader.searchpath
 
+    def test_get_env_with_rich_namespace(self):
+        namespace = {"vat_rate": 0.2, "countries": {"BR": "Brazil", "PT": "Portugal"}, "sizes": ["S", "M"]}
+        source = "{{ countries[code] }} {{ vat_rate * 100 }}{% for i in range(sizes|length) %} {{ sizes[i] }}{% endfor %}"
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={"page.txt": source}, namespace=namespace, enable_async=False
+        )
+        other_block = JinjaEnvironmentBlock(search_path="templates", namespace=dict(namespace))
+
+        assert jinja_env_block.get_namespace() is other_block.get_namespace()
+        assert jinja_env_block.get_env().globals["countries"] is other_block.get_env().globals["countries"]
+        with pytest.raises(TypeError):
+            jinja_env_block.get_namespace()["vat_rate"] = 0.1
+        with pytest.raises(TypeError):
+            jinja_env_block.get_namespace()["countries"]["ES"] = "Spain"
+        with pytest.raises(AttributeError):
+            jinja_env_block.get_namespace()["sizes"].append("L")
+        assert namespace == {"vat_rate": 0.2, "countries": {"BR": "Brazil", "PT": "Portugal"}, "sizes": ["S", "M"]}
+
+        template = jinja_env_block.get_env().get_template("page.txt")
+        assert template.render(code="PT") == "Portugal 20.0 S M"
+
+    def test_get_env_with_frozen_namespace_to_json(self):
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={"data.json": "{{ config|tojson }}"},
+            namespace={"config": {"sizes": ["S", "M"], "labels": {"S": "Small"}}},
+            enable_async=False,
+        )
+
+        template = jinja_env_block.get_env().get_template("data.json")
+        assert template.render() == '{"labels": {"S": "Small"}, "sizes": ["S", "M"]}'
+
+    def test_get_env_with_filters_tests_and_globals(self):
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={"page.txt": "{{ path|quote }} {{ path is absolute }} {{ join('a', 'b') }}"},
+            filters={"quote": "shlex:quote"},
+            tests={"absolute": "os.path:isabs"},
+            globals={"join": "posixpath:join"},
+            enable_async=False,
+        )
+
+        jinja_env = jinja_env_block.get_env()
+        assert jinja_env.filters["quote"] is shlex.quote
+        assert "upper" in jinja_env.filters
+        assert jinja_env.get_template("page.txt").render(path="/my path") == "'/my path' True a/b"
+
+    def test_get_env_without_async(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates", enable_async=False)
+
+        jinja_env = jinja_env_block.get_env()
+        assert jinja_env.is_async is False
+
+    def test_get_env_is_cached(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates", namespace={"test": "test"})
+        same_settings_block = JinjaEnvironmentBlock(search_path="templates", namespace={"test": "test"})
+        other_settings_block = JinjaEnvironmentBlock(search_path="templates", namespace={"test": "other"})
+
+        jinja_env = jinja_env_block.get_env()
+        assert jinja_env is jinja_env_block.get_env()
+        assert jinja_env is same_settings_block.get_env()
+        assert jinja_env is not other_settings_block.get_env()
+
+    def test_get_env_cache_key_follows_settings(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates", namespace={"test": "test"})
+        jinja_env = jinja_env_block.get_env()
+
+        assert JinjaEnvironmentBlock.validate(jinja_env_block).get_env() is jinja_env
+        assert jinja_env_block.copy(update={"enable_async": False}).get_env() is not jinja_env
+        jinja_env_block.namespace = {"test": "other"}
+        assert jinja_env_block.get_env() is not jinja_env
+        assert jinja_env_block.get_env().globals["test"] == "other"
+
+    def test_invalidate_env(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates")
+
+        jinja_env = jinja_env_block.get_env()
+        jinja_env_block.invalidate_env()
+        assert jinja_env is not jinja_env_block.get_env()
+
+    def test_clear_env_cache(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates")
+
+        jinja_env = jinja_env_block.get_env()
+        clear_env_cache()
+        assert jinja_env is not jinja_env_block.get_env()
+
+    def test_get_env_with_bytecode_cache_path(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "hello.txt").write_text("Hello, {{username}}!")
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=str(tmp_path / "templates"), bytecode_cache_path=str(tmp_path / "bytecode")
+        )
+
+        jinja_env = jinja_env_block.get_env()
+        assert isinstance(jinja_env.bytecode_cache, FileSystemBytecodeCache)
+
+        jinja_env.get_template("hello.txt")
+        assert len(os.listdir(tmp_path / "bytecode")) == 1
+
+    def test_get_env_with_bytecode_cache_path_shared_by_modes(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "loop.txt").write_text("{% for name in names %}{{ name }} {% endfor %}")
+        async_block = JinjaEnvironmentBlock(
+            search_path=str(tmp_path / "templates"), bytecode_cache_path=str(tmp_path / "bytecode")
+        )
+        async_block.invalidate_env()
+        async_block.get_env().get_template("loop.txt")
+
+        sync_block = async_block.copy(update={"enable_async": False})
+        sync_block.invalidate_env()
+        template = sync_block.get_env().get_template("loop.txt")
+        assert template.render(names=["a", "b"]) == "a b "
+        assert len(os.listdir(tmp_path / "bytecode")) == 2
+
+    def test_get_env_with_bytecode_cache_client(self, tmp_path):
+        (tmp_path / "hello.txt").write_text("Hello, {{username}}!")
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=str(tmp_path), bytecode_cache_client="test_blocks:bytecode_client"
+        )
+
+        jinja_env = jinja_env_block.get_env()
+        assert isinstance(jinja_env.bytecode_cache, MemcachedBytecodeCache)
+
+        jinja_env.get_template("hello.txt")
+        assert len(bytecode_client.data) == 1
+
+        jinja_env_block.invalidate_env()
+        template = jinja_env_block.get_env().get_template("hello.txt")
+        assert template.render(username="prefect") == "Hello, prefect!"
+
+    def test_compile_templates(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "hello.txt").write_text("Hello, {{username}}!")
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path / "templates"))
+
+        jinja_env_block.compile_templates(str(tmp_path / "templates.zip"))
+        compiled_env_block = JinjaEnvironmentBlock(compiled_path=str(tmp_path / "templates.zip"))
+
+        jinja_env = compiled_env_block.get_env()
+        assert isinstance(jinja_env.loader, ModuleLoader)
+        template = jinja_env.get_template("hello.txt")
+        assert template.render(username="prefect") == "Hello, prefect!"
+
+    def test_get_env_with_reload_options(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates", auto_reload=False, cache_size=10)
+
+        jinja_env = jinja_env_block.get_env()
+        assert jinja_env.auto_reload is False
+        assert jinja_env.cache.capacity == 10
+        assert isinstance(jinja_env.loader, FileSystemLoader)
+
+    def test_get_env_with_auto_reload_interval(self):
+        jinja_env_block = JinjaEnvironmentBlock(search_path="templates", auto_reload_interval=30)
+
+        jinja_env = jinja_env_block.get_env()
+        assert jinja_env.auto_reload is True
+        assert isinstance(jinja_env.loader, ThrottledReloadLoader)
+        assert jinja_env.loader.interval == 30
+
+    def test_get_dependency_graph_and_outdated_templates(self, tmp_path):
+        (tmp_path / "base.html").write_text("<body>{% block body %}{% endblock %}</body>")
+        (tmp_path / "macros.html").write_text("{% macro hello(name) %}Hello, {{ name }}!{% endmacro %}")
+        (tmp_path / "index.html").write_text(
+            "{% extends 'base.html' %}{% from 'macros.html' import hello %}{% block body %}{{ hello('a') }}{% endblock %}"
+        )
+        (tmp_path / "about.html").write_text("{% extends 'base.html' %}{% block body %}About{% endblock %}")
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+
+        assert jinja_env_block.get_dependency_graph() == {
+            "about.html": {"base.html"},
+            "base.html": set(),
+            "index.html": {"base.html", "macros.html"},
+            "macros.html": set(),
+        }
+
+        hashes = jinja_env_block.get_template_hashes()
+        assert jinja_env_block.get_outdated_templates(hashes) == []
+        assert jinja_env_block.get_outdated_templates({}) == ["about.html", "base.html", "index.html", "macros.html"]
+
+        (tmp_path / "macros.html").write_text("{% macro hello(name) %}Hi, {{ name }}!{% endmacro %}")
+        assert jinja_env_block.get_outdated_templates(hashes) == ["index.html", "macros.html"]
+
+        (tmp_path / "base.html").write_text("<main>{% block body %}{% endblock %}</main>")
+        assert jinja_env_block.get_outdated_templates(hashes) == [
+            "about.html", "base.html", "index.html", "macros.html"
+        ]
+
+    def test_get_env_with_fsspec_url(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "hello.txt").write_text("Hello, {{username}}!")
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=f"file://{tmp_path / 'templates'}", remote_cache_path=str(tmp_path / "cache")
+        )
+
+        jinja_env = jinja_env_block.get_env()
+        assert isinstance(jinja_env.loader, FsspecLoader)
+        assert jinja_env.get_template("hello.txt").render(username="prefect") == "Hello, prefect!"
+
+    def test_get_env_with_inline_templates(self):
+        jinja_env_block = JinjaEnvironmentBlock(templates={"hello.txt": "Hello, {{username}}!"})
+
+        jinja_env = jinja_env_block.get_env()
+        assert isinstance(jinja_env.loader, DictLoader)
+        assert jinja_env.get_template("hello.txt").render(username="prefect") == "Hello, prefect!"
+
+    def test_get_env_with_many_sources(self, tmp_path, monkeypatch):
+        package = tmp_path / "package" / "my_templates"
+        (package / "templates").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "templates" / "base.txt").write_text("Base: {% block body %}{% endblock %}")
+        monkeypatch.syspath_prepend(str(tmp_path / "package"))
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "footer.txt").write_text("Footer")
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "page.txt").write_text("From disk")
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={
+                "page.txt": "{% extends 'base.txt' %}{% block body %}{% include 'shared/footer.txt' %}{% endblock %}"
+            },
+            search_path=str(tmp_path / "pages"),
+            package_name="my_templates",
+            prefixes={"shared": str(tmp_path / "shared")},
+        )
+
+        jinja_env = jinja_env_block.get_env()
+        assert isinstance(jinja_env.loader, ChoiceLoader)
+        assert jinja_env.get_template("page.txt").render() == "Base: Footer"
+        assert jinja_env.loader.list_templates() == ["base.txt", "page.txt", "shared/footer.txt"]
+
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_preload(self, tmp_path, max_workers):
+        for i in range(5):
+            (tmp_path / f"template_{i}.txt").write_text(f"Template {i}: {{{{ username }}}}")
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+        jinja_env_block.invalidate_env()
+
+        timings = jinja_env_block.preload(max_workers=max_workers)
+        assert sorted(timings) == [f"template_{i}.txt" for i in range(5)]
+        assert all(seconds >= 0 for seconds in timings.values())
+        assert len(jinja_env_block.get_env().cache) == 5
+
+    def test_jinja_environment_scope(self, tmp_path):
+        outer_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+        inner_block = JinjaEnvironmentBlock(search_path=str(tmp_path), namespace={"config": "inner"})
 
+        assert get_scoped_environment() is None
+        with jinja_environment_scope(outer_block) as outer_env:
+            assert outer_env is outer_block.get_env()
+            outer_block.invalidate_env()
+            assert get_scoped_environment() == (outer_block, outer_env)
+            with jinja_environment_scope(inner_block) as inner_env:
+                assert get_scoped_environment() == (inner_block, inner_env)
+            assert get_scoped_environment()[1] is outer_env
+        assert get_scoped_environment() is None
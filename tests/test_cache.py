@@ -0,0 +1,34 @@
+import threading
+
+from prefect_jinja._cache import LRUCache
+
+
+def test_get_or_create_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    cache.get_or_create("a", lambda: 0)
+    cache.get_or_create("c", lambda: 3)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.info() == (1, 3, 2, 2)
+
+
+def test_get_or_create_does_not_block_other_keys():
+    cache = LRUCache(maxsize=2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_factory():
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    thread = threading.Thread(target=cache.get_or_create, args=("slow", slow_factory))
+    thread.start()
+    started.wait(5)
+    try:
+        assert cache.get_or_create("fast", lambda: "fast") == "fast"
+    finally:
+        release.set()
+        thread.join()
+    assert cache.get_or_create("slow", lambda: "other") == "slow"
@@ -0,0 +1,51 @@
+import pytest
+
+from prefect_jinja.blocks import JinjaEnvironmentBlock
+from prefect_jinja.cli import main
+
+
+@pytest.fixture
+def search_path(tmp_path) -> str:
+    path = tmp_path / "templates"
+    path.mkdir()
+    (path / "hello.txt").write_text("Hello, {{username}}!")
+    return str(path)
+
+
+def test_compile_to_zip(search_path, tmp_path):
+    target = str(tmp_path / "templates.zip")
+    main(["compile", target, "--search-path", search_path])
+
+    template = JinjaEnvironmentBlock(compiled_path=target).get_env().get_template("hello.txt")
+    assert template.render(username="prefect") == "Hello, prefect!"
+
+
+def test_compile_to_directory(search_path, tmp_path):
+    target = str(tmp_path / "compiled")
+    main(["compile", target, "--search-path", search_path, "--zip", "none"])
+
+    template = JinjaEnvironmentBlock(compiled_path=target).get_env().get_template("hello.txt")
+    assert template.render(username="prefect") == "Hello, prefect!"
+
+
+def test_compile_requires_a_source(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["compile", str(tmp_path / "templates.zip")])
+
+
+def test_compile_sync(search_path, tmp_path):
+    target = str(tmp_path / "templates.zip")
+    main(["compile", target, "--search-path", search_path, "--sync"])
+
+    jinja_env_block = JinjaEnvironmentBlock(compiled_path=target, enable_async=False)
+    assert jinja_env_block.get_compiled_mode() == "sync"
+    template = jinja_env_block.get_env().get_template("hello.txt")
+    assert template.render(username="prefect") == "Hello, prefect!"
+
+
+def test_compile_mode_mismatch(search_path, tmp_path):
+    target = str(tmp_path / "compiled")
+    main(["compile", target, "--search-path", search_path, "--zip", "none", "--async"])
+
+    with pytest.raises(ValueError, match="compiled in async mode, but this block renders in sync mode"):
+        JinjaEnvironmentBlock(compiled_path=target, enable_async=False).get_env()
@@ -0,0 +1,74 @@
+import os
+from uuid import uuid4
+
+import fsspec
+import pytest
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+
+from prefect_jinja import loaders
+from prefect_jinja.loaders import FsspecLoader, ThrottledReloadLoader
+
+
+class TestThrottledReloadLoader:
+    def test_list_templates(self, tmp_path):
+        (tmp_path / "hello.txt").write_text("Hello!")
+        loader = ThrottledReloadLoader(FileSystemLoader(str(tmp_path)), interval=10)
+        assert loader.list_templates() == ["hello.txt"]
+
+    def test_reload_is_throttled(self, tmp_path, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(loaders.time, "monotonic", lambda: now)
+        template_file = tmp_path / "hello.txt"
+        template_file.write_text("Hello!")
+        env = Environment(loader=ThrottledReloadLoader(FileSystemLoader(str(tmp_path)), interval=10))
+
+        assert env.get_template("hello.txt").render() == "Hello!"
+        template_file.write_text("Bye!")
+        stat = template_file.stat()
+        os.utime(template_file, (stat.st_atime, stat.st_mtime + 5))
+
+        now += 5
+        assert env.get_template("hello.txt").render() == "Hello!"
+
+        now += 10
+        assert env.get_template("hello.txt").render() == "Bye!"
+
+
+@pytest.fixture
+def memory_templates():
+    fs = fsspec.filesystem("memory")
+    root = f"/templates-{uuid4().hex}"
+    fs.pipe(f"{root}/base.txt", b"Hello, {% block name %}{% endblock %}!")
+    fs.pipe(f"{root}/pages/child.txt", b"{% extends 'base.txt' %}{% block name %}{{ username }}{% endblock %}")
+    yield fs, root
+    fs.rm(root, recursive=True)
+
+
+class TestFsspecLoader:
+    def test_get_source_and_list_templates(self, memory_templates):
+        fs, root = memory_templates
+        env = Environment(loader=FsspecLoader(f"memory://{root}"))
+
+        assert env.loader.list_templates() == ["base.txt", "pages/child.txt"]
+        assert env.get_template("pages/child.txt").render(username="prefect") == "Hello, prefect!"
+        with pytest.raises(TemplateNotFound):
+            env.get_template("missing.txt")
+
+    def test_revalidation(self, memory_templates):
+        fs, root = memory_templates
+        env = Environment(loader=FsspecLoader(f"memory://{root}"))
+
+        assert env.get_template("base.txt").render() == "Hello, !"
+        fs.pipe(f"{root}/base.txt", b"Bye, {% block name %}{% endblock %}!!")
+        assert env.get_template("base.txt").render() == "Bye, !!"
+
+    def test_disk_cache_and_prefetch(self, memory_templates, tmp_path, monkeypatch):
+        fs, root = memory_templates
+        FsspecLoader(f"memory://{root}", cache_path=str(tmp_path), prefetch=True)
+        assert len(os.listdir(tmp_path)) == 2
+
+        loader = FsspecLoader(f"memory://{root}", cache_path=str(tmp_path))
+        monkeypatch.setattr(loader.fs, "cat_file", pytest.fail)
+        source, _, uptodate = loader.get_source(Environment(), "base.txt")
+        assert source == "Hello, {% block name %}{% endblock %}!"
+        assert uptodate()
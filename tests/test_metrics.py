@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+from prefect_jinja.metrics import (
+    PrometheusMetrics,
+    RenderMetrics,
+    add_metrics_hook,
+    get_render_summary,
+    record_render,
+    remove_metrics_hook,
+)
+
+
+def test_record_render_calls_hooks_and_summarizes():
+    flow_run_id = uuid4()
+    received = []
+    add_metrics_hook(received.append)
+    try:
+        record_render(RenderMetrics("a.txt", 0.002, False, 0.010, 100, flow_run_id))
+        record_render(RenderMetrics("a.txt", 0.0, True, 0.020, 100, flow_run_id))
+        record_render(RenderMetrics("b.txt", 0.001, False, 0.001, 5, flow_run_id))
+    finally:
+        remove_metrics_hook(received.append)
+
+    assert len(received) == 3
+    assert get_render_summary(flow_run_id) == [
+        {
+            "template": "a.txt",
+            "renders": 2,
+            "cache_hit_ratio": 0.5,
+            "mean_load_ms": 1.0,
+            "mean_render_ms": 15.0,
+            "output_bytes": 200,
+        },
+        {
+            "template": "b.txt",
+            "renders": 1,
+            "cache_hit_ratio": 0.0,
+            "mean_load_ms": 1.0,
+            "mean_render_ms": 1.0,
+            "output_bytes": 5,
+        },
+    ]
+
+
+def test_prometheus_metrics_expose():
+    metrics = PrometheusMetrics(buckets=(0.01, 0.1))
+    metrics(RenderMetrics("a.txt", 0.005, False, 0.05, 10))
+    metrics(RenderMetrics("a.txt", 0.0, True, 0.5, 20))
+
+    exposed = metrics.expose()
+    assert 'prefect_jinja_renders_total{template="a.txt",cache="hit"} 1' in exposed
+    assert 'prefect_jinja_renders_total{template="a.txt",cache="miss"} 1' in exposed
+    assert 'prefect_jinja_output_bytes_total{template="a.txt"} 30' in exposed
+    assert 'prefect_jinja_render_seconds_bucket{template="a.txt",le="0.01"} 0' in exposed
+    assert 'prefect_jinja_render_seconds_bucket{template="a.txt",le="0.1"} 1' in exposed
+    assert 'prefect_jinja_render_seconds_bucket{template="a.txt",le="+Inf"} 2' in exposed
+    assert 'prefect_jinja_render_seconds_count{template="a.txt"} 2' in exposed
+    assert 'prefect_jinja_load_seconds_bucket{template="a.txt",le="0.01"} 2' in exposed
+
+
+def test_prometheus_metrics_expose_escapes_labels():
+    metrics = PrometheusMetrics(buckets=(0.01,))
+    metrics(RenderMetrics('say "hi"\\\n.txt', 0.0, True, 0.0, 1))
+
+    exposed = metrics.expose()
+    assert r'prefect_jinja_renders_total{template="say \"hi\"\\\n.txt",cache="hit"} 1' in exposed
+    assert r'prefect_jinja_render_seconds_count{template="say \"hi\"\\\n.txt"} 1' in exposed
+    assert len(exposed.splitlines()) == 14
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+
+from jinja2 import DictLoader, Environment
+
+from prefect_jinja.profiling import TemplateProfiler
+
+TEMPLATES = {
+    "page.txt": (
+        "{% macro cell(value) %}<td>{{ value }}</td>{% endmacro %}\n"
+        "<table>\n"
+        "{% for row in rows %}\n"
+        "<tr>{{ cell(row) }}</tr>\n"
+        "{% endfor %}\n"
+        "</table>"
+    )
+}
+
+
+def test_profile_sync_render():
+    env = Environment(loader=DictLoader(TEMPLATES))
+    template = env.get_template("page.txt")
+    profiler = TemplateProfiler()
+
+    with profiler:
+        template.render(rows=range(100))
+
+    report = profiler.report()
+    locations = {(profile.template, profile.lineno, profile.function) for profile in report}
+    assert ("page.txt", 4, "root") in locations
+    assert ("page.txt", 1, "macro") in locations
+    loop_line = next(profile for profile in report if profile.lineno == 4 and profile.function == "root")
+    assert loop_line.hits >= 100
+    assert loop_line.source == "<tr>{{ cell(row) }}</tr>"
+    assert "page.txt:4 (root)" in profiler.format_report()
+
+
+def test_profile_async_render():
+    env = Environment(loader=DictLoader(TEMPLATES), enable_async=True)
+    template = env.get_template("page.txt")
+    profiler = TemplateProfiler()
+
+    async def render():
+        with profiler:
+            return await template.render_async(rows=range(10))
+
+    asyncio.run(render())
+    assert any(profile.lineno == 4 for profile in profiler.report())
+
+
+def test_profiler_restores_previous_trace():
+    previous = sys.gettrace()
+    with TemplateProfiler():
+        pass
+    assert sys.gettrace() is previous
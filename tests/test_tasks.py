@@ -1,9 +1,36 @@
+import io
+import os
+import stat
+from types import SimpleNamespace
+
 import pytest
+from jinja2 import UndefinedError
 from prefect import flow, task
 from prefect.context import get_run_context
 
-from prefect_jinja.blocks import JinjaEnvironmentBlock
-from prefect_jinja.tasks import _get_template_context, jinja_render_from_template, jinja_render_from_string
+from prefect_jinja.blocks import (
+    JinjaEnvironmentBlock,
+    get_scoped_environment,
+    jinja_environment_scope,
+)
+from prefect_jinja.metrics import add_metrics_hook, remove_metrics_hook
+from prefect_jinja.tasks import (
+    _get_encoded_size,
+    _get_template_context,
+    clear_template_cache,
+    jinja_preload,
+    jinja_render_cache_key,
+    jinja_render_from_string,
+    jinja_render_from_table,
+    jinja_render_from_template,
+    jinja_render_many,
+    jinja_render_metrics_artifact,
+    jinja_render_outdated,
+    jinja_render_to_file,
+    jinja_stream_from_template,
+    shutdown_render_pool,
+    template_cache_info,
+)
 
 
 @pytest.fixture(scope="session")
@@ -57,10 +84,40 @@ def test_get_template_context():
     assert ["test"] == result["context"]["tags"]
 
 
-def test_jinja_render_from_template_with_single_template_file(single_template_file):
+def test_get_template_context_matches_task_run_dict():
+    @task(tags=["test"])
+    def get_context():
+        context = get_run_context()
+        lazy_context = _get_template_context(context)["context"]
+        return dict(lazy_context), repr(lazy_context), context.task_run.dict()
+
+    @flow
+    def test_get_template_context_matches_task_run_dict_flow():
+        return get_context()
+
+    lazy_context, lazy_repr, task_run = test_get_template_context_matches_task_run_dict_flow()
+    assert lazy_context == task_run
+    assert lazy_repr == repr(task_run)
+
+
+def test_jinja_render_template_from_string_with_context():
+    @flow
+    def jinja_render_template_from_string_with_context_flow():
+        return jinja_render_from_string.with_options(tags=["prefect", "jinja"])(
+            "{{ context.tags | sort | join(',') }} {{ context.state.type }}"
+        )
+
+    result = jinja_render_template_from_string_with_context_flow()
+    assert result == "jinja,prefect StateType.RUNNING"
+
+
+@pytest.mark.parametrize("enable_async", [True, False])
+def test_jinja_render_from_template_with_single_template_file(single_template_file, enable_async):
     @flow
     def jinja_render_from_template_with_single_template_file_flow():
-        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=single_template_file, namespace={"config": "test"}, enable_async=enable_async
+        )
         return jinja_render_from_template("single_template.txt", jinja_env_block, username="prefect-jinja")
 
     result = jinja_render_from_template_with_single_template_file_flow()
@@ -77,6 +134,349 @@ def test_jinja_render_from_template_with_inherited_template_file(inherited_templ
     assert result == "Hello, prefect-jinja!This is a inherited template with variable: test."
 
 
+def test_jinja_render_tasks_in_environment_scope(single_template_file):
+    @task
+    def get_scoped_env_id():
+        return id(get_scoped_environment()[1])
+
+    @flow
+    def jinja_render_in_environment_scope_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        with jinja_environment_scope(jinja_env_block) as jinja_env:
+            return (
+                jinja_render_from_template("single_template.txt", username="prefect"),
+                jinja_render_many("single_template.txt", None, [{"username": "jinja"}]),
+                get_scoped_env_id() == id(jinja_env),
+            )
+
+    assert jinja_render_in_environment_scope_flow() == (
+        "Hello, prefect!This is a single template with variable: test.",
+        ["Hello, jinja!This is a single template with variable: test."],
+        True,
+    )
+
+
+def test_jinja_render_from_template_without_environment(single_template_file):
+    @flow
+    def jinja_render_from_template_without_environment_flow():
+        return jinja_render_from_template("single_template.txt", username="prefect")
+
+    with pytest.raises(RuntimeError, match="no `jinja_environment_scope` is active"):
+        jinja_render_from_template_without_environment_flow()
+
+
+def test_jinja_render_many(single_template_file):
+    @flow
+    def jinja_render_many_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        return jinja_render_many(
+            "single_template.txt",
+            jinja_env_block,
+            [{"username": "prefect"}, {"username": "jinja", "config": "override"}],
+            max_concurrency=1,
+        )
+
+    result = jinja_render_many_flow()
+    assert result == [
+        "Hello, prefect!This is a single template with variable: test.",
+        "Hello, jinja!This is a single template with variable: override.",
+    ]
+
+
+@pytest.mark.parametrize("option", ["max_concurrency", "chunk_size"])
+def test_jinja_render_many_with_invalid_limits(single_template_file, option):
+    @flow
+    def jinja_render_many_with_invalid_limits_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file)
+        return jinja_render_many("single_template.txt", jinja_env_block, [{"username": "a"}], **{option: 0})
+
+    with pytest.raises(ValueError, match=f"{option} must be at least 1"):
+        jinja_render_many_with_invalid_limits_flow()
+
+
+def test_jinja_render_many_in_chunks(single_template_file, caplog):
+    @flow
+    def jinja_render_many_in_chunks_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        return jinja_render_many(
+            "single_template.txt",
+            jinja_env_block,
+            [{"username": f"user-{i}"} for i in range(5)],
+            chunk_size=2,
+        )
+
+    result = jinja_render_many_in_chunks_flow()
+    assert result == [f"Hello, user-{i}!This is a single template with variable: test." for i in range(5)]
+    for rendered in (2, 4, 5):
+        assert f"Rendered {rendered} of 5 renders of template 'single_template.txt'." in caplog.text
+
+
+def test_jinja_render_many_in_processes(single_template_file):
+    @flow
+    def jinja_render_many_in_processes_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        return jinja_render_many(
+            "single_template.txt",
+            jinja_env_block,
+            [{"username": f"user-{i}"} for i in range(10)],
+            processes=2,
+        )
+
+    result = jinja_render_many_in_processes_flow()
+    assert result == [f"Hello, user-{i}!This is a single template with variable: test." for i in range(10)]
+
+
+def test_jinja_render_many_in_processes_reuses_pool(single_template_file):
+    from prefect_jinja import _pool
+
+    @flow
+    def jinja_render_many_in_processes_twice_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        other_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "other"})
+        first = jinja_render_many("single_template.txt", jinja_env_block, [{"username": "a"}], processes=2)
+        pools = dict(_pool._pools)
+        other = jinja_render_many("single_template.txt", other_block, [{"username": "b"}], processes=2)
+        second = jinja_render_many("single_template.txt", jinja_env_block, [{"username": "c"}], processes=2)
+        return first + other + second, pools, dict(_pool._pools)
+
+    rendered, first_pools, pools = jinja_render_many_in_processes_twice_flow()
+    assert rendered == [
+        "Hello, a!This is a single template with variable: test.",
+        "Hello, b!This is a single template with variable: other.",
+        "Hello, c!This is a single template with variable: test.",
+    ]
+    assert len(pools) == 2
+    assert all(pools[key] is pool for key, pool in first_pools.items())
+    shutdown_render_pool()
+    assert not _pool._pools
+
+
+def test_render_pools_evict_least_recently_used(monkeypatch):
+    from prefect_jinja import _pool
+
+    monkeypatch.setattr(_pool, "MAX_POOLS", 2)
+    blocks = [JinjaEnvironmentBlock(templates={"a.txt": "a"}, namespace={"i": i}) for i in range(3)]
+    first, second = _pool._get_pool(blocks[0], 1), _pool._get_pool(blocks[1], 1)
+    assert _pool._get_pool(blocks[0], 1) is first
+    _pool._get_pool(blocks[2], 1)
+
+    assert list(_pool._pools.values())[0] is first
+    assert second not in _pool._pools.values()
+    with pytest.raises(RuntimeError):
+        second.submit(print)
+    shutdown_render_pool()
+
+
+def test_jinja_render_many_in_processes_with_compiled_templates(single_template_file, tmp_path):
+    compiled_path = str(tmp_path / "templates.zip")
+    JinjaEnvironmentBlock(search_path=single_template_file).compile_templates(compiled_path)
+
+    @flow
+    def jinja_render_many_in_processes_with_compiled_templates_flow():
+        jinja_env_block = JinjaEnvironmentBlock(compiled_path=compiled_path, namespace={"config": "test"})
+        return jinja_render_many(
+            "single_template.txt", jinja_env_block, [{"username": f"user-{i}"} for i in range(3)], processes=2
+        )
+
+    result = jinja_render_many_in_processes_with_compiled_templates_flow()
+    assert result == [f"Hello, user-{i}!This is a single template with variable: test." for i in range(3)]
+
+
+def test_jinja_render_many_in_processes_with_filters():
+    @flow
+    def jinja_render_many_in_processes_with_filters_flow():
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={"quoted.txt": "{{ name|quote }}"}, filters={"quote": "shlex:quote"}
+        )
+        return jinja_render_many("quoted.txt", jinja_env_block, [{"name": "a b"}, {"name": "c"}], processes=2)
+
+    assert jinja_render_many_in_processes_with_filters_flow() == ["'a b'", "c"]
+
+
+def test_jinja_render_from_template_with_strict_variables(single_template_file):
+    @flow
+    def jinja_render_from_template_with_strict_variables_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, strict_variables=True)
+        return jinja_render_from_template("single_template.txt", jinja_env_block, username="prefect-jinja")
+
+    with pytest.raises(UndefinedError, match="missing variables: config"):
+        jinja_render_from_template_with_strict_variables_flow()
+
+
+def test_jinja_render_from_template_with_strict_variables_declared_by_parent():
+    @flow
+    def jinja_render_from_template_with_strict_variables_declared_by_parent_flow():
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={
+                "table.txt": "{% set title = 'Users' %}{% extends 'base.txt' %}",
+                "base.txt": "{{ title }}:{% for item in items %} {% include 'row.txt' %}{% endfor %}",
+                "row.txt": "{{ item }}",
+            },
+            strict_variables=True,
+        )
+        return jinja_render_from_template("table.txt", jinja_env_block, items=["a", "b"])
+
+    assert jinja_render_from_template_with_strict_variables_declared_by_parent_flow() == "Users: a b"
+
+
+def test_jinja_render_from_template_with_strict_variables_in_scoped_block_and_defaults():
+    @flow
+    def jinja_render_from_template_with_strict_variables_in_scoped_block_and_defaults_flow():
+        jinja_env_block = JinjaEnvironmentBlock(
+            templates={
+                "base.txt": "{{ title|default('Users') }}:{% for item in items %}{% block row scoped %}{% endblock %}{% endfor %}",
+                "table.txt": "{% extends 'base.txt' %}{% block row %} {{ item }}{% endblock %}",
+            },
+            strict_variables=True,
+        )
+        return jinja_render_from_template("table.txt", jinja_env_block, items=["a", "b"])
+
+    assert jinja_render_from_template_with_strict_variables_in_scoped_block_and_defaults_flow() == "Users: a b"
+
+
+def test_jinja_render_from_template_with_profile(single_template_file, caplog):
+    @flow
+    def jinja_render_from_template_with_profile_flow():
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=single_template_file, namespace={"config": "test"}, profile=True
+        )
+        return jinja_render_from_template("single_template.txt", jinja_env_block, username="prefect-jinja")
+
+    result = jinja_render_from_template_with_profile_flow()
+    assert result == "Hello, prefect-jinja!This is a single template with variable: test."
+    assert "Profile of template 'single_template.txt'" in caplog.text
+    assert "single_template.txt:1 (root)" in caplog.text
+
+
+def test_jinja_stream_from_template_to_file(inherited_template_file):
+    output = io.StringIO()
+
+    @flow
+    def jinja_stream_from_template_to_file_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=inherited_template_file, namespace={"config": "test"})
+        return jinja_stream_from_template("child_template.txt", jinja_env_block, output, username="prefect-jinja")
+
+    result = jinja_stream_from_template_to_file_flow()
+    assert output.getvalue() == "Hello, prefect-jinja!This is a inherited template with variable: test."
+    assert result == len(output.getvalue())
+
+
+@pytest.mark.parametrize("enable_async", [True, False])
+def test_jinja_stream_from_template_to_callback(single_template_file, enable_async):
+    chunks = []
+
+    async def write(chunk):
+        chunks.append(chunk)
+
+    @flow
+    def jinja_stream_from_template_to_callback_flow():
+        jinja_env_block = JinjaEnvironmentBlock(
+            search_path=single_template_file, namespace={"config": "test"}, enable_async=enable_async
+        )
+        return jinja_stream_from_template(
+            "single_template.txt", jinja_env_block, write, buffer_size=8, username="prefect-jinja"
+        )
+
+    jinja_stream_from_template_to_callback_flow()
+    assert len(chunks) > 1
+    assert "".join(chunks) == "Hello, prefect-jinja!This is a single template with variable: test."
+
+
+def test_jinja_render_to_file(single_template_file, tmp_path):
+    path = str(tmp_path / "output" / "rendered.txt")
+
+    @flow
+    def jinja_render_to_file_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "tëst"})
+        return jinja_render_to_file("single_template.txt", jinja_env_block, path, username="prefect-jinja")
+
+    result = jinja_render_to_file_flow()
+    expected = "Hello, prefect-jinja!This is a single template with variable: tëst."
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == expected
+    assert result == (path, len(expected.encode("utf-8")))
+    assert os.listdir(tmp_path / "output") == ["rendered.txt"]
+
+
+def test_jinja_render_to_file_mode(tmp_path):
+    (tmp_path / "hello.txt").write_text("Hello!")
+    new_path = tmp_path / "new.txt"
+    existing_path = tmp_path / "existing.txt"
+    existing_path.write_text("previous")
+    existing_path.chmod(0o640)
+
+    @flow
+    def jinja_render_to_file_mode_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+        jinja_render_to_file("hello.txt", jinja_env_block, str(new_path))
+        jinja_render_to_file("hello.txt", jinja_env_block, str(existing_path))
+        return jinja_render_outdated(jinja_env_block, str(tmp_path / "site"), str(tmp_path / "hashes.json"))
+
+    umask = os.umask(0o022)
+    try:
+        jinja_render_to_file_mode_flow()
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(new_path.stat().st_mode) == 0o644
+    assert stat.S_IMODE(existing_path.stat().st_mode) == 0o640
+    assert stat.S_IMODE((tmp_path / "site" / "hello.txt").stat().st_mode) == 0o644
+    assert stat.S_IMODE((tmp_path / "hashes.json").stat().st_mode) == 0o644
+
+
+def test_jinja_render_to_file_keeps_previous_file_on_error(tmp_path):
+    (tmp_path / "broken.txt").write_text("{{ 1 / 0 }}")
+    path = tmp_path / "rendered.txt"
+    path.write_text("previous")
+
+    @flow
+    def jinja_render_to_file_with_error_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+        return jinja_render_to_file("broken.txt", jinja_env_block, str(path))
+
+    with pytest.raises(ZeroDivisionError):
+        jinja_render_to_file_with_error_flow()
+    assert path.read_text() == "previous"
+    assert sorted(os.listdir(tmp_path)) == ["broken.txt", "rendered.txt"]
+
+
+def test_jinja_render_outdated(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "base.html").write_text("<h1>{{ title }}</h1>{% block body %}{% endblock %}")
+    (templates / "index.html").write_text("{% extends 'base.html' %}{% block body %}Index{% endblock %}")
+    (templates / "about.html").write_text("About {{ title }}")
+    site = tmp_path / "site"
+    hashes_path = str(tmp_path / "hashes.json")
+
+    @flow
+    def jinja_render_outdated_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=str(templates))
+        return jinja_render_outdated(
+            jinja_env_block, str(site), hashes_path, names=["index.html", "about.html"], title="Acme"
+        )
+
+    assert jinja_render_outdated_flow() == ["about.html", "index.html"]
+    assert (site / "index.html").read_text() == "<h1>Acme</h1>Index"
+    assert (site / "about.html").read_text() == "About Acme"
+    assert not (site / "base.html").exists()
+
+    assert jinja_render_outdated_flow() == []
+
+    (templates / "base.html").write_text("<h2>{{ title }}</h2>{% block body %}{% endblock %}")
+    assert jinja_render_outdated_flow() == ["index.html"]
+    assert (site / "index.html").read_text() == "<h2>Acme</h2>Index"
+
+
+def test_jinja_preload(inherited_template_file):
+    @flow
+    def jinja_preload_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=inherited_template_file)
+        return jinja_preload(jinja_env_block, names=["child_template.txt"])
+
+    result = jinja_preload_flow()
+    assert list(result) == ["child_template.txt"]
+
+
 def test_jinja_render_template_from_string():
     @flow
     def jinja_render_template_from_string_flow():
@@ -84,3 +484,183 @@ def test_jinja_render_template_from_string():
 
     result = jinja_render_template_from_string_flow()
     assert result == "Hello, prefect-jinja!"
+
+
+def test_jinja_render_template_from_string_is_cached():
+    clear_template_cache()
+
+    @flow
+    def jinja_render_template_from_string_twice_flow():
+        first = jinja_render_from_string("Bye, {{username}}!", username="prefect")
+        second = jinja_render_from_string("Bye, {{username}}!", username="jinja")
+        return first, second
+
+    result = jinja_render_template_from_string_twice_flow()
+    assert result == ("Bye, prefect!", "Bye, jinja!")
+
+    cache_info = template_cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 1
+
+
+def test_jinja_render_cache_key_caches_renders(single_template_file):
+    @flow
+    def jinja_render_cached_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        cached_render = jinja_render_from_template.with_options(cache_key_fn=jinja_render_cache_key)
+        first = cached_render("single_template.txt", jinja_env_block, username="prefect", return_state=True)
+        second = cached_render("single_template.txt", jinja_env_block, username="prefect", return_state=True)
+        third = cached_render("single_template.txt", jinja_env_block, username="jinja", return_state=True)
+        return first, second, third
+
+    first, second, third = jinja_render_cached_flow()
+    assert first.name == "Completed"
+    assert second.name == "Cached"
+    assert second.result() == first.result()
+    assert third.name == "Completed"
+
+
+def test_jinja_render_cache_key_follows_parent_templates(tmp_path):
+    (tmp_path / "base.txt").write_text("Hello, {% block name %}{% endblock %}!")
+    (tmp_path / "child.txt").write_text("{% extends 'base.txt' %}{% block name %}{{ username }}{% endblock %}")
+    jinja_env_block = JinjaEnvironmentBlock(search_path=str(tmp_path))
+    context = SimpleNamespace(task=SimpleNamespace(task_key="render"))
+    parameters = {"name": "child.txt", "jinja_environment": jinja_env_block, "kwargs": {"username": "prefect"}}
+
+    key = jinja_render_cache_key(context, parameters)
+    assert key == jinja_render_cache_key(context, parameters)
+
+    (tmp_path / "base.txt").write_text("Bye, {% block name %}{% endblock %}!")
+    assert key != jinja_render_cache_key(context, parameters)
+
+    other_block = JinjaEnvironmentBlock(search_path=str(tmp_path), namespace={"config": "test"})
+    assert key != jinja_render_cache_key(context, {**parameters, "jinja_environment": other_block})
+
+
+def test_jinja_render_cache_key_with_dynamic_include():
+    jinja_env_block = JinjaEnvironmentBlock(templates={"page.txt": "{% include section %}", "intro.txt": "Intro"})
+    context = SimpleNamespace(task=SimpleNamespace(task_key="render"))
+    parameters = {"name": "page.txt", "jinja_environment": jinja_env_block, "kwargs": {"section": "intro.txt"}}
+
+    assert jinja_render_cache_key(context, parameters) is None
+
+
+def test_jinja_render_cache_key_from_string():
+    context = SimpleNamespace(task=SimpleNamespace(task_key="render"))
+
+    parameters = {"template_string": "Hello, {{ username }}!", "kwargs": {"username": "prefect"}}
+
+    key = jinja_render_cache_key(context, parameters)
+    assert key == jinja_render_cache_key(context, dict(parameters))
+    assert key != jinja_render_cache_key(context, {**parameters, "kwargs": {"username": "jinja"}})
+
+
+@pytest.mark.parametrize("text", ["", "Hello, prefect!", "Olá, tëst! " * 10000, "😀" * 70000])
+def test_get_encoded_size(text):
+    assert _get_encoded_size(text) == len(text.encode("utf-8"))
+
+
+def test_render_metrics(single_template_file):
+    received = []
+
+    @flow
+    def render_metrics_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, namespace={"config": "test"})
+        jinja_env_block.invalidate_env()
+        jinja_render_from_template("single_template.txt", jinja_env_block, username="a")
+        jinja_render_from_template("single_template.txt", jinja_env_block, username="b")
+        jinja_render_from_string("Hello, {{ username }}!", username="c")
+        return jinja_render_metrics_artifact(key="render-metrics")
+
+    clear_template_cache()
+    add_metrics_hook(received.append)
+    try:
+        artifact_id = render_metrics_flow()
+    finally:
+        remove_metrics_hook(received.append)
+
+    assert artifact_id is not None
+    assert [(metrics.template, metrics.cache_hit) for metrics in received] == [
+        ("single_template.txt", False),
+        ("single_template.txt", True),
+        ("<string>", False),
+    ]
+    assert received[0].output_bytes == len("Hello, a!This is a single template with variable: test.")
+
+
+@pytest.mark.parametrize("enable_async", [True, False])
+def test_jinja_render_from_table(single_template_file, enable_async):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"username": ["a", "b", "c"], "config": ["x", "y", "z"]})
+
+    @flow
+    def jinja_render_from_table_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file, enable_async=enable_async)
+        return jinja_render_from_table("single_template.txt", jinja_env_block, table, batch_size=2)
+
+    result = jinja_render_from_table_flow()
+    assert result.column_names == ["username", "config", "rendered"]
+    assert result.column("rendered").to_pylist() == [
+        f"Hello, {username}!This is a single template with variable: {config}."
+        for username, config in [("a", "x"), ("b", "y"), ("c", "z")]
+    ]
+
+
+def test_jinja_render_from_dataframe(single_template_file):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    dataframe = pd.DataFrame({"username": ["a", "b"], "config": ["x", "y"]}, index=[10, 20])
+
+    @flow
+    def jinja_render_from_dataframe_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file)
+        return jinja_render_from_table("single_template.txt", jinja_env_block, dataframe, column="body")
+
+    result = jinja_render_from_dataframe_flow()
+    assert list(result.index) == [10, 20]
+    assert result.loc[20, "body"] == "Hello, b!This is a single template with variable: y."
+
+
+def test_jinja_render_from_record_batches_to_parquet(single_template_file, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    input_path = str(tmp_path / "input.parquet")
+    pq.write_table(pa.table({"username": [f"user-{i}" for i in range(3)], "config": ["x"] * 3}), input_path)
+    output_path = str(tmp_path / "output" / "rendered.parquet")
+
+    @flow
+    def jinja_render_from_record_batches_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file)
+        return jinja_render_from_table(
+            "single_template.txt", jinja_env_block, pq.ParquetFile(input_path), output_path=output_path, batch_size=2
+        )
+
+    assert jinja_render_from_record_batches_flow() == output_path
+    result = pq.read_table(output_path)
+    assert result.column("rendered").to_pylist() == [
+        f"Hello, user-{i}!This is a single template with variable: x." for i in range(3)
+    ]
+    assert os.listdir(tmp_path / "output") == ["rendered.parquet"]
+
+
+def test_jinja_render_from_empty_tables(single_template_file, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({"username": pa.array([], pa.string()), "config": pa.array([], pa.string())})
+    output_path = str(tmp_path / "rendered.parquet")
+
+    @flow
+    def jinja_render_from_empty_tables_flow():
+        jinja_env_block = JinjaEnvironmentBlock(search_path=single_template_file)
+        return (
+            jinja_render_from_table("single_template.txt", jinja_env_block, table, output_path=output_path),
+            jinja_render_from_table("single_template.txt", jinja_env_block, []),
+        )
+
+    written_path, empty_table = jinja_render_from_empty_tables_flow()
+    result = pq.read_table(written_path)
+    assert result.num_rows == 0
+    assert result.schema == table.schema.append(pa.field("rendered", pa.string()))
+    assert empty_table.num_rows == 0
+    assert empty_table.column_names == ["rendered"]